@@ -17,14 +17,83 @@
 import sys
 import os
 from src.maze.Maze import Maze
-from src.output.output import put_maze_val
-from src.menu.menu import print_menu, manage_user_input
-from src.menu.menu import get_random_color, init_color
-from src.utils.error import print_error, \
-                            send_error, MenuError, ConfigurationError
+from src.output.output import put_maze_val, split_output_name
+from src.utils.error import print_error, send_error, MenuError
 from src.configuration.check_config_error import get_config
+from src.configuration.arguments import get_arguments
 from src.maze.Maze_Generator import Maze_Generator
 from src.maze.resolution import resolution
+from src.utils.profiler import Profiler
+from contextlib import nullcontext
+from argparse import Namespace
+from typing import TYPE_CHECKING, Any, ContextManager, Optional
+
+# Like the menu, the batch mode and the readers below, the cache is only
+# imported when it is used: a headless run loads as little as possible
+if TYPE_CHECKING:
+    from src.cache.cache import MazeCache
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+def build_maze(maze: Maze, config: dict[str, Any], maze_gen: Maze_Generator,
+               profiler: Optional[Profiler],
+               cache: Optional["MazeCache"] = None) -> None:
+    """
+    Generates the maze, searches for its solution and writes the output
+    file, timing each phase when a profiler is given.
+
+    With a cache, a maze already generated with the same config is loaded
+    from it instead, and a new one is stored in it.
+
+    Args:
+        maze (Maze): The maze to fill.
+        config (dict): The configuration of the maze.
+        maze_gen (Maze_Generator): The generator to use.
+        profiler (Optional[Profiler]): Collects the counters and timings.
+        cache (Optional[MazeCache]): The mazes already generated.
+    """
+
+    def phase(name: str) -> ContextManager[None]:
+        return profiler.phase(name) if profiler else nullcontext()
+
+    path = None
+    if cache is not None:
+        with phase("cache"):
+            path = cache.load(maze, config)
+        if profiler:
+            profiler.count("maze_cache_hits" if path is not None
+                           else "maze_cache_misses")
+    if path is None:
+        with phase("generate"):
+            maze_gen.generate(maze, config)
+        with phase("solve"):
+            path = resolution(maze, config, profiler=profiler)
+        if cache is not None:
+            with phase("cache"):
+                cache.store(maze, config, path)
+    with phase("output"):
+        put_maze_val(maze, config["OUTPUT_FILE"], path, profiler,
+                     config["COMPRESSION_LEVEL"])
+
+
+def get_cache(args: Namespace) -> Optional["MazeCache"]:
+    """
+    Opens the cache asked for on the command line.
+
+    Args:
+        args (Namespace): The parsed arguments.
+
+    Returns:
+        Optional[MazeCache]: The cache, or None without --cache.
+    """
+    if args.cache is None:
+        return None
+    from src.cache.cache import MazeCache
+
+    return MazeCache(args.cache, args.cache_size * 1024 * 1024)
 
 
 # +-------------------------------------------------------------------------+
@@ -40,7 +109,24 @@ if __name__ == "__main__":
     - Generating the maze
     - Searching for the solution
     - Generating the output file
-    - Displaying the menu
+    - Displaying the menu, unless the program runs headless (HEADLESS key,
+      or standard output not being a terminal)
+
+    With --solve, --validate or --stats, it reads an existing output file
+    instead, without any config file.
+
+    With --serve, it answers JSON generation requests over HTTP instead,
+    until interrupted.
+
+    With --seeds or --count, it generates one maze per seed in a pool of
+    processes instead, and writes a manifest of the outputs.
+
+    With --cache, headless runs reuse the mazes already generated with the
+    same config.
+
+    With --profile (or the PROFILE key), the counters and timings of the
+    generation, the resolution and the output are written next to the
+    output file.
 
     It also handles the KeyboardInterrupt exception to display a custom message
     when the user interrupts the program.
@@ -48,33 +134,88 @@ if __name__ == "__main__":
 
     try:
         # Get arguments
-        argc = len(sys.argv)
-        argv = sys.argv
+        args = get_arguments(sys.argv[1:])
 
-        if (argc != 2):
-            send_error(ConfigurationError(), "Wrong arguments. "
-                       "Need one file.")
+        if args.read is not None:
+            # Solve, validate or describe an existing output file
+            from src.output.reader import read_output
+            from src.utils.error import OutputFileError
 
-        color = init_color()
-        get_random_color(color)
+            action, filename = args.read
+            try:
+                sys.exit(read_output(filename, action, args.force))
+            except OutputFileError as e:
+                send_error(e, str(e))
+
+        if args.serve is not None:
+            # Answer generation requests until interrupted
+            from src.service.service import run_service
+
+            run_service(args.serve, args.workers, args.concurrency,
+                        get_cache(args), args.max_cells)
+            sys.exit(0)
+
+        # Configuration recovery
+        config = get_config(args.config)
+
+        if args.seeds is not None or args.count is not None:
+            # Batch generation, always headless
+            from src.batch.batch import run_batch
+
+            seeds = args.seeds
+            if seeds is None:
+                first = config.get("SEED", 0)
+                seeds = range(first, first + args.count)
+            manifest = run_batch(config, seeds, args.output_dir,
+                                 args.workers, args.chunk, get_cache(args))
+            print(f"{len(seeds)} mazes generated, manifest: {manifest}")
+            sys.exit(0)
+
+        profiler = None
+        if args.profile or config["PROFILE"]:
+            profiler = Profiler(args.cprofile)
+        profile_file = (split_output_name(config["OUTPUT_FILE"])[0]
+                        + "_profile.json")
+
+        if config["HEADLESS"] and config["GENERATOR"] == "ELLER":
+            # Stream the rows to the output, the maze is never in memory
+            with profiler.phase("generate") if profiler else nullcontext():
+                Maze_Generator().stream_eller(config, config["OUTPUT_FILE"])
+            if profiler:
+                profiler.write(profile_file)
+                print(f"Profile written to {profile_file}")
+            sys.exit(0)
+
+        if config["HEADLESS"]:
+            # Generate, solve and write the output without any rendering
+            maze = Maze(config["WIDTH"], config["HEIGHT"],
+                        config["ENTRY"], config["EXIT"], {})
+            build_maze(maze, config,
+                       Maze_Generator(None, profiler, args.workers),
+                       profiler, get_cache(args))
+            if profiler:
+                profiler.write(profile_file)
+                print(f"Profile written to {profile_file}")
+            sys.exit(0)
+
+        # The menu and the animation are only loaded when displayed
+        from src.menu.menu import print_menu, manage_user_input
+        from src.menu.menu import get_random_color, init_color
+        from src.menu.terminal_observer import TerminalObserver
 
         color = init_color()
         get_random_color(color)
-        # Configuration recovery
-        config = get_config(argv[1])
 
         # Generating maze
         maze = Maze(config["WIDTH"], config["HEIGHT"],
                     config["ENTRY"], config["EXIT"], color)
 
-        maze_gen = Maze_Generator()
-        maze_gen.hunt_and_kill(maze, config)
-
-        # Searching for solution
-        path = resolution(maze, config)
-
-        # Generating output
-        put_maze_val(maze, config["OUTPUT_FILE"], path)
+        # Generating maze, searching for solution and generating output
+        maze_gen = Maze_Generator(TerminalObserver(0.02), profiler,
+                                  args.workers)
+        build_maze(maze, config, maze_gen, profiler)
+        if profiler:
+            profiler.write(profile_file)
 
         # Displaying the menu
         i = 0
@@ -0,0 +1,16 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  __main__.py                                       :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 13:10:26 by tcolson         #+#    #+#               #
+#  Updated: 2026/10/18 13:10:26 by tcolson         ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+import sys
+from benchmarks.bench import main
+
+sys.exit(main())
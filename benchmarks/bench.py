@@ -0,0 +1,324 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  bench.py                                          :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 13:10:26 by tcolson         #+#    #+#               #
+#  Updated: 2026/10/18 13:10:26 by tcolson         ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from src.maze.Maze import Maze
+from src.maze.Maze_Generator import Maze_Generator
+from src.maze.resolution import resolution
+from src.output.output import put_maze_val
+from typing import Any, Callable
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+
+# +-------------------------------------------------------------------------+
+# |                                Variable                                 |
+# +-------------------------------------------------------------------------+
+
+SIZES = [21, 101, 501, 1001, 2001, 4001]
+STAGES = ["generate", "solve", "render", "output"]
+# The timings depend on the machine, so the baseline is kept outside of
+# the repository unless --baseline says otherwise
+BASELINE = os.path.join(tempfile.gettempdir(), "a_maze_ing_baseline.json")
+
+# Regressions smaller than this are timing noise, whatever the threshold
+MIN_SECONDS = 0.005
+MIN_BYTES = 64 * 1024
+
+# A headless run of a small maze, from the start of the interpreter to the
+# written output, must fit in this budget, without loading these modules
+PROGRAM = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), "a_maze_ing.py")
+STARTUP_CONFIG = ("WIDTH=21\nHEIGHT=21\nENTRY=1,1\nEXIT=19,19\n"
+                  "OUTPUT_FILE=startup.txt\nPERFECT=True\nSEED=42\n"
+                  "HEADLESS=True\n")
+STARTUP_BUDGET = 60.0
+STARTUP_RUNS = 11
+HEADLESS_FORBIDDEN = ("rich", "src.menu", "src.utils.theme",
+                      "src.utils.effect", "src.cache", "cProfile",
+                      "multiprocessing", "concurrent")
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+def get_config(size: int, seed: int, filename: str) -> dict[str, Any]:
+    """
+    Builds the configuration of a square maze of the ladder. The solver is
+    pinned, and no spanning tree is recorded, so that the "solve" stage
+    times a search and not a walk up the tree (see solve_tree()).
+
+    Args:
+        size (int): Width and height of the maze.
+        seed (int): Seed of the generation.
+        filename (str): Output file of the "output" stage.
+
+    Returns:
+        dict: A configuration, as returned by get_config().
+    """
+    return {"WIDTH": size, "HEIGHT": size,
+            "ENTRY": (1, 1), "EXIT": (size - 2, size - 2),
+            "OUTPUT_FILE": filename, "PERFECT": True, "SEED": seed,
+            "HIDE": True, "HEADLESS": True, "SOLVER": "BFS",
+            "RECORD_TREE": False}
+
+
+def run_stages(config: dict[str, Any],
+               trace: bool) -> dict[str, tuple[float, int]]:
+    """
+    Runs every stage once, headless, on the maze of a configuration.
+
+    Args:
+        config (dict): The configuration of the maze.
+        trace (bool): Whether to measure the peak memory of each stage with
+            tracemalloc (which slows the stages down).
+
+    Returns:
+        dict: For each stage, its wall time in seconds and its peak memory
+        in bytes (0 when not traced).
+    """
+    # The menu (and rich) is only loaded for the colors of the render
+    # stage, before any stage is timed
+    from src.menu.menu import init_color
+
+    results: dict[str, tuple[float, int]] = {}
+    state: dict[str, Any] = {}
+
+    def generate() -> None:
+        state["maze"] = Maze(config["WIDTH"], config["HEIGHT"],
+                             config["ENTRY"], config["EXIT"], init_color())
+        Maze_Generator().hunt_and_kill(state["maze"], config)
+
+    def solve() -> None:
+        state["path"] = resolution(state["maze"], config)
+
+    def render() -> None:
+        state["maze"].show_maze()
+
+    def output() -> None:
+        put_maze_val(state["maze"], config["OUTPUT_FILE"], state["path"])
+
+    stages: dict[str, Callable[[], None]] = {
+        "generate": generate, "solve": solve,
+        "render": render, "output": output}
+
+    for name in STAGES:
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        stages[name]()
+        seconds = time.perf_counter() - start
+        peak = 0
+        if trace:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        results[name] = (seconds, peak)
+
+    return results
+
+
+def run_benchmark(sizes: list[int], seed: int,
+                  memory: bool) -> dict[str, dict[str, dict[str, float]]]:
+    """
+    Measures every stage on every size of the ladder.
+
+    Times come from a first run without tracemalloc, peak memory from a
+    second run under tracemalloc, so the tracing doesn't skew the times.
+
+    Args:
+        sizes (list): Width and height of each maze of the ladder.
+        seed (int): Seed of every generation.
+        memory (bool): Whether to measure the peak memory.
+
+    Returns:
+        dict: size -> stage -> {"seconds", "peak_bytes", "cells_per_second"}
+    """
+    results: dict[str, dict[str, dict[str, float]]] = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            config = get_config(size, seed,
+                                os.path.join(directory, "bench.txt"))
+            with contextlib.redirect_stdout(io.StringIO()):
+                timed = run_stages(config, False)
+                traced = run_stages(config, True) if memory else {}
+
+            cells = size * size
+            results[str(size)] = {}
+            for name in STAGES:
+                seconds = timed[name][0]
+                speed = cells / seconds if seconds else 0
+                peak = traced[name][1] if memory else 0
+                results[str(size)][name] = {
+                    "seconds": round(seconds, 6),
+                    "peak_bytes": peak,
+                    "cells_per_second": round(speed)}
+                print(f"{size:>6}² {name:<10} {seconds:>10.4f} s "
+                      f"{speed:>14,.0f} cells/s {peak / 2**20:>10.1f} MiB",
+                      flush=True)
+
+    return results
+
+
+def get_regressions(results: dict[str, dict[str, dict[str, float]]],
+                    baseline: dict[str, dict[str, dict[str, float]]],
+                    threshold: float) -> list[str]:
+    """
+    Compares results with a baseline.
+
+    A stage regresses when its time or its peak memory grows by more than
+    `threshold` (0.25 = 25%) of the baseline, and by more than the noise
+    floor (MIN_SECONDS, MIN_BYTES).
+
+    Returns:
+        list: A message per regression.
+    """
+    regressions = []
+    for size, stages in results.items():
+        for name, result in stages.items():
+            before = baseline.get(size, {}).get(name)
+            if before is None:
+                continue
+            for key, floor in (("seconds", MIN_SECONDS),
+                               ("peak_bytes", MIN_BYTES)):
+                if not result[key] or not before[key]:
+                    continue
+                if result[key] > before[key] * (1 + threshold) and \
+                   result[key] - before[key] > floor:
+                    growth = result[key] / before[key] - 1
+                    regressions.append(f"{name} {size}²: {key} "
+                                       f"{before[key]} -> {result[key]} "
+                                       f"(+{growth:.0%})")
+    return regressions
+
+
+def check_startup(budget: float) -> list[str]:
+    """
+    Measures the startup of a headless run: the median wall time of
+    STARTUP_RUNS runs of the program on a 21x21 maze, and the modules it
+    imports, listed by `python3 -X importtime`.
+
+    Args:
+        budget (float): The allowed wall time, in milliseconds.
+
+    Returns:
+        list: A message per regression: over budget, or a module of
+        HEADLESS_FORBIDDEN imported.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "startup.cfg"), "w") as file:
+            file.write(STARTUP_CONFIG)
+
+        def run(*options: str) -> subprocess.CompletedProcess[str]:
+            return subprocess.run([sys.executable, *options, PROGRAM,
+                                   "startup.cfg"], cwd=directory,
+                                  capture_output=True, text=True)
+
+        imports = run("-X", "importtime").stderr.splitlines()
+        times = []
+        for _ in range(STARTUP_RUNS):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+
+    modules = [line.rpartition("|")[2].strip() for line in imports
+               if line.startswith("import time:")][1:]
+    milliseconds = statistics.median(times) * 1000
+    print(f"startup    {milliseconds:>8.1f} ms {len(modules):>6} modules "
+          f"(budget: {budget:.0f} ms)", flush=True)
+
+    regressions = []
+    if milliseconds > budget:
+        regressions.append(f"startup: {milliseconds:.1f} ms, over the "
+                           f"budget of {budget:.0f} ms")
+    for module in modules:
+        if any(module == name or module.startswith(name + ".")
+               for name in HEADLESS_FORBIDDEN):
+            regressions.append(f"startup: {module} imported by a headless "
+                               "run")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point of `python3 -m benchmarks`.
+
+    Checks the startup of a headless run (see check_startup()), runs the
+    benchmark, writes the results to --output, then compares them with the
+    baseline. The baseline is created when missing and replaced with
+    --update.
+
+    Returns:
+        int: 1 if a stage regressed past the threshold or the startup
+        failed its check, 0 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python3 -m benchmarks",
+        description="Benchmark generation, solving, rendering and output.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES,
+                        metavar="N", help="width and height of the mazes")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed growth before failing (0.25 = 25%%)")
+    parser.add_argument("--baseline", default=BASELINE, metavar="FILE",
+                        help=f"results to compare with (default: {BASELINE})")
+    parser.add_argument("--output", metavar="FILE",
+                        help="where to write the results")
+    parser.add_argument("--update", action="store_true",
+                        help="replace the baseline with these results")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc run")
+    parser.add_argument("--startup-budget", type=float,
+                        default=STARTUP_BUDGET, metavar="MS",
+                        help="allowed startup of a headless run "
+                        f"(default: {STARTUP_BUDGET:.0f} ms)")
+    parser.add_argument("--no-startup", action="store_true",
+                        help="skip the startup check")
+    args = parser.parse_args(argv)
+
+    startup = [] if args.no_startup else check_startup(args.startup_budget)
+    results = run_benchmark(args.sizes, args.seed, not args.no_memory)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=1)
+
+    for regression in startup:
+        print(f"Regression: {regression}")
+    if args.update or not os.path.exists(args.baseline):
+        with open(args.baseline, "w") as file:
+            json.dump(results, file, indent=1)
+        print(f"Baseline written to {args.baseline}")
+        return 1 if startup else 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    regressions = get_regressions(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"Regression: {regression}")
+    if not regressions:
+        print(f"No regression against {args.baseline}")
+    return 1 if regressions or startup else 0
@@ -1,25 +1,130 @@
 # This script does not check for errors or malformed files.
-# It only validates that neighbooring cells sharing a wall have
-#  both the correct encoding.
-# Usage: python3 output_validator.py output_maze.txt
+# It only validates that every cell is a hexadecimal digit, and that
+#  neighbooring cells sharing a wall have both the correct encoding.
+# The file is read one row at a time, so only two rows are ever kept in
+#  memory, and each row is checked as a whole with bytes.translate().
+# Compressed outputs (.txt.gz, .txt.xz) are decompressed, and binary ones
+#  (.mzb) decoded, on the fly.
+# Exit status: 0 if the maze is valid, 1 on usage error or unreadable file,
+#  2 otherwise.
+# Usage: python3 output_validator.py output_maze.txt [max_errors]
 
+from src.output.binary import BINARY_EXT, read_header, get_binary_rows
+from src.output.output import HEX_TABLE, open_output
+from src.utils.error import OutputFileError
+from typing import BinaryIO, Iterator
+import lzma
 import sys
 
-if len(sys.argv) != 2:
-    print(f"Usage: python3 {sys.argv[0]} <output_file>")
-    sys.exit(1)
-
-g = []
-for line in open(sys.argv[1]):
-    if line.strip() == '':
-        break
-    g.append([int(c, 16) for c in line.strip(' \t\n\r')])
-
-for r in range(len(g)):
-    for c in range(len(g[0])):
-        v = g[r][c]
-        if not all([(r < 1 or v & 1 == (g[r-1][c] >> 2) & 1),
-                    (c >= len(g[0])-1 or (v >> 1) & 1 == (g[r][c+1] >> 3) & 1),
-                    (r >= len(g)-1 or (v >> 2) & 1 == g[r+1][c] & 1),
-                    (c < 1 or (v >> 3) & 1 == (g[r][c-1] >> 1) & 1)]):
-            print(f'Wrong encoding for ({c},{r})')
+# One table per wall: hexadecimal digit -> value of its bit (0 or 1).
+# Anything that is not a digit maps to 2, and is reported on its own.
+DIGITS = b"0123456789ABCDEFabcdef"
+IS_DIGIT = bytes(char in DIGITS for char in range(256))
+
+
+def wall_table(bit: int) -> bytes:
+    table = bytearray([2]) * 256
+    for char in DIGITS:
+        table[char] = (int(chr(char), 16) >> bit) & 1
+    return bytes(table)
+
+
+NORTH, EAST, SOUTH, WEST = (wall_table(bit) for bit in range(4))
+
+
+def mismatches(a: bytes, b: bytes) -> list[int]:
+    """Return the positions where two equal-length rows of bits differ."""
+    if a == b:
+        return []
+    return [i for i in range(len(a)) if a[i] != b[i]]
+
+
+def get_lines(file: BinaryIO, filename: str) -> Iterator[bytes]:
+    """Yield the rows of an output file, as lines of hexadecimal digits."""
+    if not filename.endswith(BINARY_EXT):
+        yield from file
+        return
+    cols, rows, *_ = read_header(file)
+    for row in get_binary_rows(file, cols, rows):
+        yield row.translate(HEX_TABLE) + b"\n"
+
+
+def validate(filename: str, max_errors: int) -> tuple[int, list[str]]:
+    """
+    Check every shared wall of the maze stored in filename.
+
+    Returns the number of badly encoded cells and the messages of the
+    first max_errors ones.
+    """
+    errors: set[tuple[int, int]] = set()
+    count = 0
+    messages: list[str] = []
+
+    def report(cells: set[tuple[int, int]]) -> None:
+        nonlocal count
+        for c, r in sorted(cells, key=lambda cell: (cell[1], cell[0])):
+            count += 1
+            if len(messages) < max_errors:
+                messages.append(f'Wrong encoding for ({c},{r})')
+
+    previous = b""
+    with open_output(filename, mode="rb") as file:
+        for r, line in enumerate(get_lines(file, filename)):
+            row = line.strip(b" \t\n\r")
+            if row == b"":
+                break
+            if r > 0 and len(row) != len(previous):
+                report(errors)
+                errors = set()
+                count += 1
+                messages.append(f'Wrong width for row {r}: {len(row)} '
+                                f'instead of {len(previous)}')
+                break
+
+            # Cells which are not a digit at all
+            if row.translate(None, DIGITS):
+                for c in mismatches(row.translate(IS_DIGIT),
+                                    b"\x01" * len(row)):
+                    errors.add((c, r))
+
+            # Shared vertical walls inside the row
+            for c in mismatches(row.translate(EAST)[:-1],
+                                row.translate(WEST)[1:]):
+                errors.update({(c, r), (c + 1, r)})
+
+            # Shared horizontal walls with the previous row
+            if r > 0:
+                for c in mismatches(previous.translate(SOUTH),
+                                    row.translate(NORTH)):
+                    errors.update({(c, r - 1), (c, r)})
+
+            # Cells of the previous row can't be reported anymore
+            report({cell for cell in errors if cell[1] < r})
+            errors = {cell for cell in errors if cell[1] == r}
+            previous = row
+
+    report(errors)
+    return count, messages
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print(f"Usage: python3 {sys.argv[0]} <output_file> [max_errors]")
+        sys.exit(1)
+
+    try:
+        max_errors = int(sys.argv[2]) if len(sys.argv) == 3 else 20
+    except ValueError:
+        print(f"Usage: python3 {sys.argv[0]} <output_file> [max_errors]")
+        sys.exit(1)
+
+    try:
+        count, messages = validate(sys.argv[1], max_errors)
+    except (OSError, EOFError, lzma.LZMAError, OutputFileError) as e:
+        print(f"Can't read {sys.argv[1]}: {e}")
+        sys.exit(1)
+    for message in messages:
+        print(message)
+    if count > len(messages):
+        print(f'... and {count - len(messages)} more')
+    sys.exit(2 if count else 0)
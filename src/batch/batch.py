@@ -0,0 +1,134 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  batch.py                                          :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 12:21:37 by alebaron        #+#    #+#               #
+#  Updated: 2026/10/18 12:21:37 by alebaron        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from src.maze.Maze import Maze
+from src.maze.Maze_Generator import Maze_Generator
+from src.maze.resolution import resolution
+from src.output.output import put_maze_val, split_output_name
+from src.output.output import DEFAULT_LEVEL
+from src.cache.cache import MazeCache
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any
+import json
+import os
+import time
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+def get_output_name(config: dict[str, Any], seed: int,
+                    output_dir: str) -> str:
+    """
+    Builds the name of the output file of a seed: OUTPUT_FILE with the seed
+    added before its extension (e.g. maze.txt -> maze_42.txt).
+
+    Args:
+        config (dict): The base configuration.
+        seed (int): The seed of the maze.
+        output_dir (str): The directory of the outputs.
+
+    Returns:
+        str: The path of the output file.
+    """
+    stem, ext = split_output_name(config["OUTPUT_FILE"])
+    return os.path.join(output_dir, f"{stem}_{seed}{ext}")
+
+
+def generate_seed(config: dict[str, Any], seed: int, output_dir: str,
+                  cache: MazeCache | None = None) -> dict[str, Any]:
+    """
+    Generates, solves and writes the maze of one seed, without any display.
+    This is the task run by the worker processes.
+
+    Args:
+        config (dict): The base configuration.
+        seed (int): The seed of the maze.
+        output_dir (str): The directory of the outputs.
+        cache (MazeCache | None): The mazes already generated.
+
+    Returns:
+        dict: The manifest entry of the maze.
+    """
+    config = dict(config, SEED=seed, HIDE=True)
+    filename = get_output_name(config, seed, output_dir)
+    start = time.perf_counter()
+
+    maze = Maze(config["WIDTH"], config["HEIGHT"],
+                config["ENTRY"], config["EXIT"], {})
+    path = cache.load(maze, config) if cache is not None else None
+    if path is None:
+        # The seeds are already spread over the processes
+        Maze_Generator(workers=1).generate(maze, config)
+        path = resolution(maze, config)
+        if cache is not None:
+            cache.store(maze, config, path)
+    put_maze_val(maze, filename, path,
+                 level=config.get("COMPRESSION_LEVEL", DEFAULT_LEVEL))
+
+    return {"seed": seed,
+            "output_file": filename,
+            "path_length": len(path),
+            "seconds": round(time.perf_counter() - start, 6)}
+
+
+def run_batch(config: dict[str, Any], seeds: range, output_dir: str = ".",
+              workers: int | None = None, chunk: int | None = None,
+              cache: MazeCache | None = None) -> str:
+    """
+    Generates one maze per seed in a pool of processes, then writes a JSON
+    manifest listing every output.
+
+    Each process imports the program once and then receives the seeds by
+    chunks, so the cost of starting an interpreter is paid once per worker
+    instead of once per maze.
+
+    Args:
+        config (dict): The base configuration, its SEED is ignored.
+        seeds (range): The seeds to generate.
+        output_dir (str): The directory of the outputs and the manifest.
+        workers (int | None): Number of processes, CPU count by default.
+        chunk (int | None): Seeds sent to a process at once. By default,
+            about four chunks per worker.
+        cache (MazeCache | None): The mazes already generated, shared by
+            the processes.
+
+    Returns:
+        str: The path of the manifest.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    chunk = chunk or max(1, len(seeds) // (workers * 4))
+    start = time.perf_counter()
+
+    task = partial(generate_seed, config, output_dir=output_dir,
+                   cache=cache)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        mazes = list(executor.map(task, seeds, chunksize=chunk))
+
+    stem, _ = split_output_name(os.path.basename(config["OUTPUT_FILE"]))
+    manifest = os.path.join(output_dir, f"{stem}_manifest.json")
+    with open(manifest, "w") as file:
+        json.dump({"config": {key: value for key, value in config.items()
+                              if key not in ("SEED", "HIDE", "HEADLESS")},
+                   "workers": workers,
+                   "chunk": chunk,
+                   "seconds": round(time.perf_counter() - start, 6),
+                   "mazes": mazes}, file)
+    return manifest
@@ -0,0 +1,158 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  cache.py                                          :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 18:32:50 by alebaron        #+#    #+#               #
+#  Updated: 2026/10/18 18:32:50 by alebaron        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from src.maze.Maze import Maze, CLEAN_PATH_TABLE
+from src.maze.Maze_Generator import GENERATOR_VERSION
+from src.maze.tiled import TILE_SIZE
+from src.maze.resolution import get_path_cells
+from typing import Any
+import hashlib
+import json
+import os
+import zlib
+
+
+# +-------------------------------------------------------------------------+
+# |                                Variable                                 |
+# +-------------------------------------------------------------------------+
+
+# Keys of the config that change the maze or its solution, with the value
+# used when they are missing. A missing LOOP_DENSITY stays None: Eller's
+# generator then uses its own LOOP_CHANCE, not a density of 0
+CACHE_KEYS: dict[str, Any] = {
+    "WIDTH": None, "HEIGHT": None, "ENTRY": None, "EXIT": None,
+    "PERFECT": None, "SEED": None, "GENERATOR": "HUNT_AND_KILL",
+    "BULK_RANDOM": False, "LOOP_DENSITY": None, "SOLVER": "BFS",
+}
+
+CACHE_EXT = ".maze"
+
+
+# +-------------------------------------------------------------------------+
+# |                                 Class                                   |
+# +-------------------------------------------------------------------------+
+
+class MazeCache:
+    """
+    On-disk cache of generated and solved mazes.
+
+    A maze only depends on its configuration and on the version of the
+    generators, so each entry is named after a hash of both. An entry holds
+    the solution and the compressed grid, without the marks of the path.
+    Only the configurations with a SEED are cached, the others can't be
+    generated again anyway.
+
+    The entries used last are kept: every hit updates the modification
+    time of its file, and storing a new entry removes the oldest ones until
+    the directory fits in its size limit.
+
+    Attributes:
+        directory (str): Directory of the entries.
+        max_bytes (int): Size limit of the directory.
+
+    Methods:
+        get_key(self, config: dict[str, Any]) -> str | None:
+            Returns the name of the entry of a configuration.
+
+        load(self, maze: Maze, config: dict[str, Any]) -> str | None:
+            Fills a maze from its entry and returns its solution.
+
+        store(self, maze: Maze, config: dict[str, Any], path: str) -> None:
+            Writes the entry of a generated and solved maze.
+
+        evict(self) -> int:
+            Removes the oldest entries over the size limit.
+    """
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def get_key(self, config: dict[str, Any]) -> str | None:
+        if config.get("SEED") is None:
+            return None
+        normalized = {key: config.get(key, default)
+                      for key, default in CACHE_KEYS.items()}
+        normalized["VERSION"] = GENERATOR_VERSION
+        # The tiles only change the mazes of the tiled generator
+        if normalized["GENERATOR"] == "TILED":
+            normalized["TILE_SIZE"] = config.get("TILE_SIZE", TILE_SIZE)
+        text = json.dumps(normalized, sort_keys=True)
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    def get_filename(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_EXT)
+
+    def load(self, maze: Maze, config: dict[str, Any]) -> str | None:
+        key = self.get_key(config)
+        if key is None:
+            return None
+        filename = self.get_filename(key)
+        try:
+            with open(filename, "rb") as file:
+                header = json.loads(file.readline())
+                grid = zlib.decompress(file.read())
+        except (OSError, ValueError, zlib.error):
+            return None
+        if len(grid) != len(maze.grid):
+            return None
+
+        os.utime(filename)
+        path: str = header["path"]
+        maze.grid[:] = grid
+        maze.touch_all()
+        maze.set_solution(config.get("SOLVER", "BFS"), path,
+                          get_path_cells(maze.width, config["ENTRY"], path))
+        return path
+
+    def store(self, maze: Maze, config: dict[str, Any], path: str) -> None:
+        key = self.get_key(config)
+        if key is None:
+            return
+        filename = self.get_filename(key)
+        # Written aside then renamed, so a reader never sees half an entry
+        temp = f"{filename}.{os.getpid()}.tmp"
+        with open(temp, "wb") as file:
+            file.write(json.dumps({"path": path}).encode() + b"\n")
+            grid = maze.grid.translate(CLEAN_PATH_TABLE)
+            file.write(zlib.compress(grid))
+        os.replace(temp, filename)
+        self.evict()
+
+    def evict(self) -> int:
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(CACHE_EXT):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+
+        removed = 0
+        entries.sort()
+        for _, size, filename in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(filename)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,170 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  arguments.py                                      :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 12:04:55 by alebaron        #+#    #+#               #
+#  Updated: 2026/10/18 12:04:55 by alebaron        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                                 Import                                  |
+# +-------------------------------------------------------------------------+
+
+
+from src.utils.error import send_error, ConfigurationError
+import argparse
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+def get_arguments(argv: list[str]) -> argparse.Namespace:
+    """
+    Parses the command line of a_maze_ing.py.
+
+    Without any option, the program generates the maze of the config file
+    and opens the menu. The batch options generate one maze per seed
+    instead, in a pool of processes, and --serve answers generation
+    requests until interrupted. --solve, --validate, --stats and
+    --convert read an existing output file, and need no config file.
+
+    Args:
+        argv (list): The command line arguments, without the program name.
+
+    Returns:
+        argparse.Namespace: The parsed arguments. `seeds` is None, or the
+        range of seeds to generate in batch. `read` is None, or the action
+        to run on an output file and its name.
+    """
+    parser = argparse.ArgumentParser(
+        prog="a_maze_ing.py",
+        description="Generate, solve and display a maze from a config file.")
+    parser.add_argument("config", nargs="?",
+                        help="path to the configuration file")
+
+    read = parser.add_argument_group("existing outputs")
+    action = read.add_mutually_exclusive_group()
+    action.add_argument("--solve", metavar="FILE",
+                        help="print a shortest path of an output file")
+    action.add_argument("--validate", metavar="FILE",
+                        help="check the format and the walls of an output "
+                        "file")
+    action.add_argument("--stats", metavar="FILE",
+                        help="print the statistics of an output file")
+    action.add_argument("--convert", metavar="FILE",
+                        help="convert an output file between the text "
+                        "(.txt) and binary (.mzb) formats")
+    read.add_argument("--force", action="store_true",
+                      help="let --convert replace an existing file")
+
+    batch = parser.add_argument_group("batch generation")
+    batch.add_argument("--seeds", metavar="START:END",
+                       help="generate one maze per seed of the range")
+    batch.add_argument("--count", type=int, metavar="N",
+                       help="generate N mazes, from SEED (or 0) onwards")
+    batch.add_argument("--workers", type=int, metavar="N",
+                       help="number of processes, also used by "
+                       "GENERATOR=TILED (default: CPU count)")
+    batch.add_argument("--chunk", type=int, metavar="N",
+                       help="seeds sent to a process at once")
+    batch.add_argument("--output-dir", default=".", metavar="DIR",
+                       help="directory of the outputs and the manifest")
+
+    profile = parser.add_argument_group("profiling")
+    profile.add_argument("--profile", action="store_true",
+                         help="write the counters and timings of the run "
+                         "to <OUTPUT_FILE>_profile.json")
+    profile.add_argument("--cprofile", action="store_true",
+                         help="also dump cProfile stats to "
+                         "<OUTPUT_FILE>_profile.pstats (implies --profile)")
+
+    service = parser.add_argument_group("service")
+    service.add_argument("--serve", metavar="ADDRESS",
+                         help="answer JSON generate/solve requests over "
+                         "HTTP on HOST:PORT, or unix:PATH for a Unix socket "
+                         "(uses --workers and --cache)")
+    service.add_argument("--concurrency", type=int, metavar="N",
+                         help="requests run at the same time, the others "
+                         "are refused (default: twice the workers)")
+    service.add_argument("--max-cells", type=int, metavar="N",
+                         help="largest WIDTH x HEIGHT of a request, larger "
+                         "mazes are refused (default: 4001 x 4001)")
+
+    cache = parser.add_argument_group("cache")
+    cache.add_argument("--cache", metavar="DIR",
+                       help="reuse the mazes generated with the same config "
+                       "and SEED, stored in DIR")
+    cache.add_argument("--cache-size", type=int, default=256, metavar="MB",
+                       help="size limit of the cache, the mazes used last "
+                       "are kept (default: 256)")
+
+    args = parser.parse_args(argv)
+    args.read = None
+    for key in ("solve", "validate", "stats", "convert"):
+        if getattr(args, key) is not None:
+            args.read = (key, getattr(args, key))
+    if args.serve is not None:
+        check_address(args.serve)
+    elif args.config is None and args.read is None:
+        send_error(ConfigurationError(), "The configuration file is "
+                   "missing.")
+    args.profile = args.profile or args.cprofile
+    args.seeds = check_seed_range(args.seeds) if args.seeds else None
+
+    if args.count is not None:
+        if args.seeds is not None:
+            send_error(ConfigurationError(), "--seeds and --count can't be "
+                       "used together.")
+        if args.count < 1:
+            send_error(ConfigurationError(), "--count must be positive.")
+    for key in ("workers", "chunk", "cache_size", "concurrency",
+                "max_cells"):
+        if getattr(args, key) is not None and getattr(args, key) < 1:
+            send_error(ConfigurationError(), f"--{key.replace('_', '-')} "
+                       "must be positive.")
+
+    return args
+
+
+def check_seed_range(value: str) -> range:
+    """
+    Converts a "START:END" string into the range of seeds it describes,
+    END being excluded.
+
+    Args:
+        value (str): The string to convert.
+
+    Returns:
+        range: The seeds of the batch.
+    """
+    try:
+        start, end = (int(bound) for bound in value.split(":"))
+    except ValueError:
+        send_error(ConfigurationError(), "--seeds must be START:END "
+                   "(E.g: 0:1000)")
+    if end <= start:
+        send_error(ConfigurationError(), "--seeds must not be empty.")
+    return range(start, end)
+
+
+def check_address(value: str) -> None:
+    """
+    Ensures the address of the service is "HOST:PORT" or "unix:PATH".
+
+    Args:
+        value (str): The address to check.
+    """
+    if value.startswith("unix:"):
+        if value == "unix:":
+            send_error(ConfigurationError(), "--serve unix: needs the path "
+                       "of the socket.")
+        return
+    _, _, port = value.rpartition(":")
+    if not port.isdigit() or not 0 < int(port) < 65536:
+        send_error(ConfigurationError(), "--serve must be HOST:PORT or "
+                   "unix:PATH (E.g: localhost:8042)")
@@ -17,6 +17,7 @@
 
 from src.utils.error import send_error, ConfigurationError
 import re
+import sys
 from typing import Any
 
 
@@ -78,8 +79,16 @@ def required_config_format(filename: str) -> None:
         regex pattern.
     """
     with open(filename, "r") as file:
-        lines = file.read().splitlines()
+        check_config_format(file.read().splitlines())
 
+
+def check_config_format(lines: list[str]) -> None:
+    """
+    Verifies that every non-comment line follows the 'KEY=VALUE' format.
+
+    Args:
+        lines (list): The lines of the configuration.
+    """
     for line in lines:
         if line.startswith("#") or line == "":
             continue
@@ -97,12 +106,37 @@ def required_config_key(filename: str) -> dict[str, Any]:
     and validates values.
 
     Mandatory keys: WIDTH, HEIGHT, ENTRY, EXIT, OUTPUT_FILE, PERFECT.
+    Optional keys: SEED, HEADLESS (defaults to True when the standard
+    output is not a terminal), SOLVER (BFS, ASTAR, BIBFS, TREE or
+    BACKTRACKING, defaults to BFS), PROFILE (defaults to False), BULK_RANDOM
+    (defaults to False), RECORD_TREE (defaults to True with SOLVER=TREE,
+    else False), GENERATOR (HUNT_AND_KILL,
+    ELLER, KRUSKAL or TILED, defaults to HUNT_AND_KILL), TILE_SIZE (cells
+    per side of a tile with TILED, at least 2, defaults to 256),
+    LOOP_DENSITY (between 0 and 1, only for imperfect mazes),
+    COMPRESSION_LEVEL (0 to 9, for .gz and .xz outputs, defaults to 6).
     Also performs logic checks (e.g., entry and exit must not be
     identical or adjacent).
 
     Args:
         filename (str): The path to the configuration file.
 
+    Returns:
+        dict: The processed configuration dictionary.
+    """
+    with open(filename, "r") as file:
+        return parse_config(file.read().splitlines(), filename)
+
+
+def parse_config(lines: list[str], source: str) -> dict[str, Any]:
+    """
+    Builds and validates the configuration from its 'KEY=VALUE' lines (see
+    required_config_key()).
+
+    Args:
+        lines (list): The lines of the configuration.
+        source (str): Where the lines come from, for the error messages.
+
     Returns:
         dict: The processed configuration dictionary.
     """
@@ -115,9 +149,6 @@ def required_config_key(filename: str) -> dict[str, Any]:
                     "PERFECT": False
                     }
 
-    with open(filename, "r") as file:
-        lines = file.read().splitlines()
-
     for line in lines:
         if line.startswith("#") or line == "":
             continue
@@ -132,7 +163,7 @@ def required_config_key(filename: str) -> dict[str, Any]:
     for key in key_required:
         if key_required[key] is False:
             send_error(ConfigurationError(), f"Key \"{key}\" is missing in"
-                       f" {filename}.")
+                       f" {source}.")
 
     # Value Type Conversion and Range Validation
     dict_config["WIDTH"] = check_int_key("WIDTH",
@@ -167,17 +198,69 @@ def required_config_key(filename: str) -> dict[str, Any]:
         except ValueError:
             send_error(ConfigurationError(), "SEED must be an integer.")
 
+    if "HEADLESS" in dict_config:
+        dict_config["HEADLESS"] = check_bool_key("HEADLESS",
+                                                 dict_config["HEADLESS"])
+    else:
+        dict_config["HEADLESS"] = not sys.stdout.isatty()
+
+    dict_config["SOLVER"] = check_choice_key("SOLVER",
+                                             dict_config.get("SOLVER", "BFS"),
+                                             ["BFS", "ASTAR", "BIBFS",
+                                              "TREE", "BACKTRACKING"])
+
+    dict_config["PROFILE"] = check_bool_key("PROFILE",
+                                            dict_config.get("PROFILE",
+                                                            "False"))
+    dict_config["BULK_RANDOM"] = check_bool_key("BULK_RANDOM",
+                                                dict_config.get("BULK_RANDOM",
+                                                                "False"))
+    dict_config["RECORD_TREE"] = check_bool_key(
+        "RECORD_TREE", dict_config.get("RECORD_TREE",
+                                       str(dict_config["SOLVER"] == "TREE")))
+    dict_config["GENERATOR"] = check_choice_key("GENERATOR",
+                                                dict_config.get(
+                                                    "GENERATOR",
+                                                    "HUNT_AND_KILL"),
+                                                ["HUNT_AND_KILL", "ELLER",
+                                                 "KRUSKAL", "TILED"])
+    dict_config["TILE_SIZE"] = check_int_key(
+        "TILE_SIZE", dict_config.get("TILE_SIZE", "256"), 2, None)
+
+    # Eller's, Kruskal's and the tiled algorithms only carve the cells of
+    # the output
+    if dict_config["GENERATOR"] in ("ELLER", "KRUSKAL", "TILED"):
+        for key in ("ENTRY", "EXIT"):
+            x, y = dict_config[key]
+            if x % 2 == 0 or y % 2 == 0 or \
+               x >= dict_config["WIDTH"] - 1 or \
+               y >= dict_config["HEIGHT"] - 1:
+                send_error(ConfigurationError(), "With GENERATOR="
+                           f"{dict_config['GENERATOR']}, {key} must have "
+                           "odd coordinates, inside the outer walls.")
+
+    dict_config["COMPRESSION_LEVEL"] = check_int_key(
+        "COMPRESSION_LEVEL", dict_config.get("COMPRESSION_LEVEL", "6"), 0, 9)
+
+    if "LOOP_DENSITY" in dict_config:
+        dict_config["LOOP_DENSITY"] = check_float_key(
+            "LOOP_DENSITY", dict_config["LOOP_DENSITY"], 0.0, 1.0)
+        if dict_config["PERFECT"] and dict_config["LOOP_DENSITY"] > 0:
+            send_error(ConfigurationError(), "LOOP_DENSITY adds loops, it "
+                       "needs PERFECT=False.")
+
     return (dict_config)
 
 
-def check_int_key(key: str, value: str, min: int, max: int | None) -> int:
+def check_int_key(key: str, value: str, min: int | None,
+                  max: int | None) -> int:
     """
     Validates that a value is an integer and falls within the specified range.
 
     Args:
         key (str): The name of the configuration key.
         value (str): The string value to convert and check.
-        min (int): The minimum allowed value.
+        min (int | None): The minimum allowed value (None for no limit).
         max (int | None): The maximum allowed value (None for no limit).
 
     Returns:
@@ -185,9 +268,9 @@ def check_int_key(key: str, value: str, min: int, max: int | None) -> int:
     """
     try:
         key_int = int(value)
-        if min and min > key_int:
+        if min is not None and min > key_int:
             raise ValueError(f"{key} must be greater than {min}")
-        if max and max < key_int:
+        if max is not None and max < key_int:
             raise ValueError(f"{key} must be lower than {max}")
     except Exception as e:
         send_error(ConfigurationError(), str(e))
@@ -195,6 +278,30 @@ def check_int_key(key: str, value: str, min: int, max: int | None) -> int:
     return key_int
 
 
+def check_float_key(key: str, value: str, min: float, max: float) -> float:
+    """
+    Validates that a value is a number within the specified range.
+
+    Args:
+        key (str): The name of the configuration key.
+        value (str): The string value to convert and check.
+        min (float): The minimum allowed value.
+        max (float): The maximum allowed value.
+
+    Returns:
+        float: The validated number.
+    """
+    try:
+        key_float = float(value)
+    except ValueError:
+        send_error(ConfigurationError(), f"{key} must be a number")
+    if not min <= key_float <= max:
+        send_error(ConfigurationError(), f"{key} must be between {min} and "
+                   f"{max}")
+
+    return key_float
+
+
 def check_coord_key(key: str, value: str,
                     dict_data: dict[str, Any]) -> tuple[int, int]:
     """
@@ -253,16 +360,37 @@ def check_bool_key(key: str, value: str) -> bool:
         return False
 
 
+def check_choice_key(key: str, value: str, choices: list[str]) -> str:
+    """
+    Ensures the provided value is one of the allowed choices.
+
+    Args:
+        key (str): The name of the key.
+        value (str): The string value to validate.
+        choices (list): The allowed values.
+
+    Returns:
+        str: The validated value.
+    """
+    if value not in choices:
+        send_error(ConfigurationError(), f"{key} must be one of "
+                   f"{', '.join(choices)}")
+    return value
+
+
 def check_file_key(key: str, value: str) -> None:
     """
-    Ensures the provided value is a valid filename ending in '.txt'.
+    Ensures the provided value is a valid filename ending in '.txt' (or
+    '.txt.gz' and '.txt.xz' to compress it), or in '.mzb' for the binary
+    format.
 
     Args:
         key (str): The name of the key.
         value (str): The filename string to validate.
     """
-    regex = r"^[A-Za-z_]+\.txt$"
+    regex = r"^[A-Za-z_]+\.(txt|txt\.gz|txt\.xz|mzb)$"
     result = re.search(regex, value)
 
     if result is None:
-        send_error(ConfigurationError(), f"{key} must be a .txt filename")
+        send_error(ConfigurationError(), f"{key} must be a .txt, .txt.gz, "
+                   ".txt.xz or .mzb filename")
@@ -15,8 +15,9 @@
 # +-------------------------------------------------------------------------+
 
 
-from enum import Enum
-from typing import Tuple, Dict
+from enum import Enum, IntEnum
+from typing import Tuple, Dict, Iterator, Any
+from array import array
 import sys
 
 
@@ -90,6 +91,79 @@ class Cell(Enum):
     SOLVE = "•"
 
 
+class CellCode(IntEnum):
+    """
+    Small integer codes used to store each Cell in the flat grid buffer of
+    a Maze. Every member has the same name as its Cell counterpart.
+    """
+    ENTRY = 0
+    EXIT = 1
+    BLANK = 2
+    WALL = 3
+    STRICT = 4
+    SOLVE = 5
+
+
+# Lookup tables between the two representations, indexed by code.
+CODE_TO_CELL: tuple[Cell, ...] = tuple(Cell[code.name] for code in CellCode)
+CELL_TO_CODE: dict[Cell, int] = {cell: int(CellCode[cell.name])
+                                 for cell in Cell}
+
+# bytearray.translate() tables used to reset the grid in a single pass.
+CLEAN_MAZE_TABLE = bytes(code if code in (CellCode.ENTRY, CellCode.EXIT,
+                                          CellCode.STRICT)
+                         else CellCode.WALL for code in range(256))
+CLEAN_PATH_TABLE = bytes(CellCode.BLANK if code == CellCode.SOLVE else code
+                         for code in range(256))
+
+# Codes of a cell which is open whether a path goes through it or not
+PATH_CODES = (CellCode.BLANK, CellCode.SOLVE)
+
+# Beyond this many changed cells, a whole frame is cheaper to draw
+MAX_DIRTY = 4096
+
+# bytes.translate() table: cell code -> 1 if a path can go through it
+OPEN_TABLE = bytes(code in (CellCode.ENTRY, CellCode.EXIT, CellCode.BLANK,
+                            CellCode.SOLVE) for code in range(256))
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+def get_logo_cells(width: int, height: int) -> list[Tuple[int, int]]:
+    """
+    Returns the cells of the "42" logo drawn in the middle of a maze of the
+    given size, or an empty list if the maze is too small for it.
+
+    The logo only depends on the size of the maze, so generators which
+    never build a Maze (like the streaming one) can still avoid it.
+
+    Args:
+        width (int): The width of the maze.
+        height (int): The height of the maze.
+
+    Returns:
+        list[Tuple[int, int]]: The (x, y) coordinates of the logo cells.
+    """
+    if width < 9 or height < 7:
+        return []
+    midx, midy = (int(width/2), int(height/2))
+    return [
+        # ## 4 ## #
+        (midx - 1, midy), (midx - 2, midy), (midx - 3, midy),
+        (midx - 3, midy - 1), (midx - 3, midy - 2),
+        (midx - 1, midy + 1), (midx - 1, midy + 2),
+
+        # ## 2 ## #
+        (midx + 1, midy), (midx + 2, midy), (midx + 3, midy),
+        (midx + 3, midy - 1), (midx + 3, midy - 2),
+        (midx + 1, midy - 2), (midx + 2, midy - 2),
+        (midx + 1, midy + 1), (midx + 1, midy + 2),
+        (midx + 2, midy + 2), (midx + 3, midy + 2),
+    ]
+
+
 # +-------------------------------------------------------------------------+
 # |                                 Class                                   |
 # +-------------------------------------------------------------------------+
@@ -102,6 +176,60 @@ class MazeError(Exception):
     pass
 
 
+class GridView:
+    """
+    Dictionary-like view over the flat grid buffer of a Maze.
+
+    It keeps the historical `maze.maze[(x, y)]` access working by
+    translating coordinates into `y * width + x` and codes into Cell
+    members. Coordinates outside the grid raise KeyError, like the
+    dictionary it replaces.
+    """
+
+    def __init__(self, owner: "Maze") -> None:
+        self.owner = owner
+
+    def _index(self, cell: Tuple[int, int]) -> int:
+        x, y = cell
+        if not (0 <= x < self.owner.width and 0 <= y < self.owner.height):
+            raise KeyError(cell)
+        return y * self.owner.width + x
+
+    def __getitem__(self, cell: Tuple[int, int]) -> Cell:
+        return CODE_TO_CELL[self.owner.grid[self._index(cell)]]
+
+    def __setitem__(self, cell: Tuple[int, int], val: Cell) -> None:
+        i = self._index(cell)
+        self.owner.grid[i] = CELL_TO_CODE[val]
+        self.owner.touch(i)
+
+    def __contains__(self, cell: object) -> bool:
+        try:
+            self._index(cell)  # type: ignore[arg-type]
+        except (KeyError, TypeError, ValueError):
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for x in range(self.owner.width):
+            for y in range(self.owner.height):
+                yield (x, y)
+
+    def __len__(self) -> int:
+        return len(self.owner.grid)
+
+    def get(self, cell: Tuple[int, int],
+            default: Cell | None = None) -> Cell | None:
+        try:
+            return self[cell]
+        except KeyError:
+            return default
+
+    def items(self) -> Iterator[Tuple[Tuple[int, int], Cell]]:
+        for cell in self:
+            yield (cell, self[cell])
+
+
 class Maze:
     """
     A class representing a maze structure with customizable+
@@ -112,8 +240,30 @@ class Maze:
         height (int): The height of the maze.
         entry (Tuple[int, int]): The coordinates of the maze entry point.
         exit (Tuple[int, int]): The coordinates of the maze exit point.
-        maze (Dict[Tuple[int, int], Cell]): A dictionary mapping
+        grid (bytearray): The flat grid buffer, one CellCode per cell,
+            stored at index `y * width + x`.
+        maze (GridView): A dictionary-like view of `grid` mapping
             cell coordinates to their types.
+        version (int): Mutation counter, bumped by every change of the grid.
+        layout (int): Mutation counter of the walls only, bumped by every
+            change of the grid but the marking of a path.
+        solution (tuple | None): The last solution found, with the layout
+            and the solver it was found for (see `get_solution`).
+        distances (array | None): Distance of every cell to the exit, -1
+            if it can't be reached, computed for the layout in
+            `distances_layout` (see `get_distances`).
+        tree (bytearray | None): The spanning tree recorded by the
+            generator of a perfect maze, for the layout in `tree_layout`:
+            the direction code (1-4, N E S W) of the move from its parent
+            to every carved cell, 0 for the root and the other cells (see
+            `get_tree`).
+        tracked (bool): Whether an observer renders the changes (see
+            `render_changes`), set while it is attached. The changes are
+            not recorded otherwise, and nothing would drain them.
+        dirty (set[int]): Grid indexes changed since the last call to
+            `render_changes`, while `tracked`.
+        redraw (bool): Whether the next `render_changes` must draw the
+            whole frame (set when too much changed at once).
         color (Dict[str, Color]): A dictionary mapping cell types
             to their corresponding colors.
         THEMES (Dict[str, Dict[str, str]]): A dictionary of themes
@@ -131,6 +281,9 @@ class Maze:
             Changes the type of a specific cell in the maze,
             ensuring it is editable and valid.
 
+        index(self, cell: Tuple[int, int]) -> int:
+            Returns the position of a cell in the flat grid buffer.
+
         is_editable(self, cell: Tuple[int, int]) -> bool:
             Checks if a specific cell can be edited
             (i.e., it is not an entry, exit, or strict cell).
@@ -151,7 +304,46 @@ class Maze:
 
         show_maze(self) -> str:
             Generates a string representation of the maze,
-            including borders and colored cell types.
+            including borders and colored cell types. The string is cached
+            until the grid, the colors or the theme change.
+
+        render_changes(self, row: int = 1, col: int = 1) -> str:
+            Generates the ANSI sequences redrawing only the cells changed
+            since the last call, for a frame drawn at (row, col).
+
+        touch(self, index: int) -> None:
+            Records a change of the cell at a grid index.
+
+        touch_all(self) -> None:
+            Records a change of the whole grid, which will be redrawn.
+
+        mark_dirty(self, index: int) -> None:
+            Records a grid index to redraw, or the whole frame once more
+            than MAX_DIRTY cells changed.
+
+        get_solution(self, solver: str) -> tuple[str, list[int]] | None:
+            Returns the path and the path cells found by a solver, if the
+            walls didn't change since.
+
+        set_solution(self, solver: str, path: str,
+                     cells: list[int]) -> None:
+            Stores the solution found by a solver for the current walls.
+
+        get_distances(self) -> array:
+            Returns the distance field from the exit, computed once per
+            layout by a breadth-first search.
+
+        set_tree(self, tree: bytearray) -> None:
+            Stores the spanning tree recorded for the current walls.
+
+        get_tree(self) -> bytearray | None:
+            Returns the spanning tree, if the walls didn't change since.
+
+        get_distance(self, cell: Tuple[int, int]) -> int:
+            Returns the number of steps from a cell to the exit.
+
+        get_path_from(self, cell: Tuple[int, int]) -> str:
+            Returns a shortest path from a cell to the exit.
 
         change_keys(self, key: int | str) -> None:
             Changes the current theme for visual representation
@@ -165,12 +357,22 @@ class Maze:
         self.height: int = height
         self.entry: tuple[int, int] = (-1, -1)
         self.exit: tuple[int, int] = (-1, -1)
-        self.maze: dict[tuple[int, int], Cell] = {}
+        self.grid: bytearray = bytearray([CellCode.WALL]) * (width * height)
+        self.maze: GridView = GridView(self)
         self.color: dict[str, Color | str] = color
+        self.version: int = 0
+        self.layout: int = 0
+        self.solution: tuple[int, str, str, list[int]] | None = None
+        self.distances: array[int] | None = None
+        self.distances_layout: int = -1
+        self.tree: bytearray | None = None
+        self.tree_layout: int = -1
+        self.tracked: bool = False
+        self.dirty: set[int] = set()
+        self.redraw: bool = True
+        self.frame: str = ""
+        self.frame_key: tuple[Any, ...] | None = None
 
-        for x in range(width):
-            for y in range(height):
-                self.maze.update({(x, y): Cell.WALL})
         self.put_logo()
         try:
             self.change_cell(entry, Cell.ENTRY)
@@ -206,21 +408,137 @@ class Maze:
 
         self.key = self.THEMES["Default"]
 
+    def index(self, cell: Tuple[int, int]) -> int:
+        x, y = cell
+        return y * self.width + x
+
     def change_cell(self, cell: Tuple[int, int], val: Cell) -> None:
         x, y = cell
-        if x > self.width or y > self.height:
+        if not (0 <= x < self.width and 0 <= y < self.height):
             raise MazeError("Cell is not even in the maze")
-        if cell in [self.entry, self.exit] or self.maze[cell] == Cell.STRICT:
+        i = y * self.width + x
+        if cell in [self.entry, self.exit] or \
+           self.grid[i] == CellCode.STRICT:
             raise MazeError(f"This cell can't be edited, {cell}")
         if not isinstance(val, Cell):
             raise MazeError("Invalid value, should be of Cell type")
-        self.maze[cell] = val
+        code = CELL_TO_CODE[val]
+        # Marking or unmarking a path doesn't move any wall
+        if self.grid[i] not in PATH_CODES or code not in PATH_CODES:
+            self.layout += 1
+        self.grid[i] = code
+        self.version += 1
+        self.mark_dirty(i)
+
+    def touch(self, index: int) -> None:
+        self.version += 1
+        self.layout += 1
+        self.mark_dirty(index)
+
+    def mark_dirty(self, index: int) -> None:
+        # Only the frame is redrawn past MAX_DIRTY: the layout must not
+        # change when only a path was marked
+        if self.tracked and not self.redraw:
+            self.dirty.add(index)
+            if len(self.dirty) > MAX_DIRTY:
+                self.dirty.clear()
+                self.redraw = True
+
+    def touch_all(self) -> None:
+        self.version += 1
+        self.layout += 1
+        self.dirty.clear()
+        self.redraw = True
+
+    def get_solution(self, solver: str) -> tuple[str, list[int]] | None:
+        if self.solution is None:
+            return None
+        layout, found_by, path, cells = self.solution
+        if layout != self.layout or found_by != solver:
+            return None
+        return path, cells
+
+    def set_solution(self, solver: str, path: str, cells: list[int]) -> None:
+        self.solution = (self.layout, solver, path, cells)
+
+    def set_tree(self, tree: bytearray) -> None:
+        self.tree = tree
+        self.tree_layout = self.layout
+
+    def get_tree(self) -> bytearray | None:
+        if self.tree_layout != self.layout:
+            return None
+        return self.tree
+
+    def get_distances(self) -> "array[int]":
+        if self.distances is not None and \
+           self.distances_layout == self.layout:
+            return self.distances
+
+        width = self.width
+        is_open = self.grid.translate(OPEN_TABLE)
+        last_row = len(is_open) - width
+        # int32 (typecode "i"), -1 for the cells not reached yet
+        distances = array("i", [-1]) * len(is_open)
+        goal = self.index(self.exit)
+        distances[goal] = 0
+        frontier = [goal]
+        steps = 0
+
+        # One level of the search at a time, so the distance of a whole
+        # level is known without being stored next to every cell
+        while frontier:
+            steps += 1
+            next_frontier = []
+            for i in frontier:
+                x = i % width
+                for n, possible in ((i - width, i >= width),
+                                    (i + 1, x != width - 1),
+                                    (i + width, i < last_row),
+                                    (i - 1, x != 0)):
+                    if possible and is_open[n] and distances[n] < 0:
+                        distances[n] = steps
+                        next_frontier.append(n)
+            frontier = next_frontier
+
+        self.distances = distances
+        self.distances_layout = self.layout
+        return distances
+
+    def get_distance(self, cell: Tuple[int, int]) -> int:
+        x, y = cell
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise MazeError("Cell is not even in the maze")
+        return self.get_distances()[y * self.width + x]
+
+    def get_path_from(self, cell: Tuple[int, int]) -> str:
+        distances = self.get_distances()
+        width = self.width
+        last_row = len(distances) - width
+        i = self.index(cell)
+        steps = self.get_distance(cell)
+        path = []
+
+        # Any neighbour one step closer is on a shortest path
+        while steps > 0:
+            x = i % width
+            steps -= 1
+            for n, direction, possible in ((i - width, "N", i >= width),
+                                           (i + 1, "E", x != width - 1),
+                                           (i + width, "S", i < last_row),
+                                           (i - 1, "W", x != 0)):
+                if possible and distances[n] == steps:
+                    i = n
+                    path.append(direction)
+                    break
+        return "".join(path)
 
     def is_editable(self, cell: Tuple[int, int]) -> bool:
         x, y = cell
-        if x > self.width or y > self.height:
+        if not (0 <= x < self.width and 0 <= y < self.height):
             return False
-        if cell in [self.entry, self.exit] or self.maze[cell] == Cell.STRICT:
+        if cell in [self.entry, self.exit] or \
+           self.grid[y * self.width + x] == CellCode.STRICT:
             return False
 
         return True
@@ -237,71 +555,79 @@ class Maze:
 
     def put_logo(self) -> None:
         if self.is_ok_for_logo():
-            midx, midy = (int(self.width/2), int(self.height/2))
-            # ## 4 ## #
-            self.change_cell((midx - 1, midy), Cell.STRICT)
-            self.change_cell((midx - 2, midy), Cell.STRICT)
-            self.change_cell((midx - 3, midy), Cell.STRICT)
-            self.change_cell((midx - 3, midy - 1), Cell.STRICT)
-            self.change_cell((midx - 3, midy - 2), Cell.STRICT)
-            self.change_cell((midx - 1, midy + 1), Cell.STRICT)
-            self.change_cell((midx - 1, midy + 2), Cell.STRICT)
-
-            # ## 2 ## #
-            self.change_cell((midx + 1, midy), Cell.STRICT)
-            self.change_cell((midx + 2, midy), Cell.STRICT)
-            self.change_cell((midx + 3, midy), Cell.STRICT)
-            self.change_cell((midx + 3, midy - 1), Cell.STRICT)
-            self.change_cell((midx + 3, midy - 2), Cell.STRICT)
-            self.change_cell((midx + 1, midy - 2), Cell.STRICT)
-            self.change_cell((midx + 2, midy - 2), Cell.STRICT)
-            self.change_cell((midx + 1, midy + 1), Cell.STRICT)
-            self.change_cell((midx + 1, midy + 2), Cell.STRICT)
-            self.change_cell((midx + 2, midy + 2), Cell.STRICT)
-            self.change_cell((midx + 3, midy + 2), Cell.STRICT)
+            for cell in get_logo_cells(self.width, self.height):
+                self.change_cell(cell, Cell.STRICT)
 
         else:
             print(f"{MazeError().__class__.__name__}: Can't draw 42 pattern.")
 
     def clean_maze(self) -> None:
-
-        for x in range(0, self.width):
-            for y in range(0, self.height):
-                if (self.is_editable((x, y))):
-                    self.change_cell((x, y), Cell.WALL)
+        self.grid[:] = self.grid.translate(CLEAN_MAZE_TABLE)
+        self.touch_all()
 
     def clean_path(self) -> None:
-        for x in range(0, self.width):
-            for y in range(0, self.height):
-                if (self.maze[(x, y)] == Cell.SOLVE):
-                    self.change_cell((x, y), Cell.BLANK)
+        grid = self.grid
+        i = grid.find(CellCode.SOLVE)
+        if i == -1:
+            return
+        while self.tracked and not self.redraw and i != -1:
+            self.mark_dirty(i)
+            i = grid.find(CellCode.SOLVE, i + 1)
+        grid[:] = grid.translate(CLEAN_PATH_TABLE)
+        self.version += 1
+
+    def get_glyphs(self) -> list[str]:
+        return [f"{self.color[cell.name]}{self.key[cell.name]}"
+                f"{Color.RESET.value}" for cell in CODE_TO_CELL]
 
     def show_maze(self) -> str:
-        str_maze = ""
+        # The colors can be edited in place, so they are part of the key
+        frame_key = (self.version, id(self.key), tuple(self.color.items()))
+        if frame_key == self.frame_key:
+            return self.frame
+
+        border = f"{self.color['STRICT']}{self.key['STRICT']}"
+        glyphs = self.get_glyphs()
+        width = self.width
+        grid = self.grid
 
-        # Top border
-        for x in range(self.width + 2):
-            str_maze += (f"{self.color['STRICT']}{self.key['STRICT']}")
-        str_maze += "\n"
-        # Maze
+        lines = [border * (width + 2)]
         for y in range(self.height):
-            str_maze += (f"{self.color['STRICT']}{self.key['STRICT']}")
-            for x in range(self.width):
-                str_maze += f"{self.color[self.maze[(x, y)].name]}"
-                str_maze += f"{self.key[self.maze[(x, y)].name]}"
-                str_maze += Color.RESET.value
-            str_maze += f"{self.color['STRICT']}{self.key['STRICT']}\n"
-        # Lower border
-        for x in range(self.width + 2):
-            str_maze += f"{self.color['STRICT']}{self.key['STRICT']}"
-        str_maze += Color.RESET.value
-
-        return str_maze
+            row = grid[y * width:(y + 1) * width]
+            lines.append(border + "".join([glyphs[code] for code in row])
+                         + border)
+        lines.append(border * (width + 2) + Color.RESET.value)
+
+        self.frame = "\n".join(lines)
+        self.frame_key = frame_key
+        return self.frame
+
+    def render_changes(self, row: int = 1, col: int = 1) -> str:
+        # Whole frame, one cursor move per line
+        if self.redraw:
+            self.redraw = False
+            self.dirty.clear()
+            return "".join(f"\033[{row + y};{col}H{line}" for y, line
+                           in enumerate(self.show_maze().split("\n")))
+
+        # Only the changed cells, every glyph being as wide as a blank
+        glyphs = self.get_glyphs()
+        cell_width = len(self.key["BLANK"])
+        width = self.width
+        grid = self.grid
+        changes = []
+        for i in sorted(self.dirty):
+            y, x = divmod(i, width)
+            changes.append(f"\033[{row + 1 + y};{col + cell_width * (x + 1)}H"
+                           f"{glyphs[grid[i]]}")
+        self.dirty.clear()
+        return "".join(changes)
 
     def change_keys(self, key: str) -> None:
 
         try:
             self.key = self.THEMES[key]
+            self.redraw = True
         except KeyError:
             print(f"{MazeError().__class__.__name__}: "
                   "Wrong key in change_keys()")
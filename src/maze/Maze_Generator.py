@@ -15,12 +15,22 @@
 # +-------------------------------------------------------------------------+
 
 
-from .Maze import Maze, Cell
+from .Maze import Maze, Cell, CellCode, get_logo_cells, MazeError
+from .observer import MazeObserver
+from .eller import get_eller_rows
+from .kruskal import carve_kruskal, add_loops
+from .tiled import carve_tiled, TILE_SIZE
+from src.output.output import put_rows_val, DEFAULT_LEVEL
+from src.utils.profiler import Profiler, CountingObserver
 import random
-from rich.live import Live
-from rich.text import Text
-import time
-from typing import Any
+import sys
+from typing import Any, Callable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Bumped by every change of the generators that changes the maze of a seed,
+# so that mazes cached by an older version are never used
+GENERATOR_VERSION = 1
 
 
 # +-------------------------------------------------------------------------+
@@ -28,9 +38,195 @@ from typing import Any
 # +-------------------------------------------------------------------------+
 
 class Maze_Generator:
+    """
+    Generates mazes, optionally reporting every carved cell to an observer.
+
+    Attributes:
+        observer (MazeObserver): Receives the progress of the generation.
+            The default one does nothing, which is the headless mode.
+        profiler (Profiler | None): Counts the kill walks and steps, the
+            hunts and the rows they scan, the neighbor lookups and the
+            render calls, when profiling is enabled.
+        random (random.Random): The random number generator of this
+            generator only, reseeded from SEED at each generation. Several
+            generators can therefore run in the same process, even in
+            threads, without changing each other's mazes.
+        workers (int | None): Number of processes of the tiled generation,
+            CPU count by default.
+    """
+
+    def __init__(self, observer: MazeObserver | None = None,
+                 profiler: Profiler | None = None,
+                 workers: int | None = None) -> None:
+        self.observer: MazeObserver = observer or MazeObserver()
+        self.profiler: Profiler | None = profiler
+        self.random = random.Random()
+        self.workers = workers
+
+    def seed_random(self, config: dict[str, Any]) -> random.Random:
+        """
+        Seeds the random number generator of this generator from the SEED
+        of the config. Without SEED, a random one is drawn and stored as
+        RANDOM_SEED, so the maze can still be reproduced.
+
+        Args:
+            config (dict): The configuration of the maze.
+
+        Returns:
+            random.Random: The seeded generator.
+        """
+        rng = self.random
+        try:
+            rng.seed(config["SEED"])
+        except Exception:
+            seed = random.SystemRandom().randint(0, 314159265358979)
+            config["RANDOM_SEED"] = seed
+            rng.seed(config["RANDOM_SEED"])
+        return rng
+
+    def generate(self, maze: Maze, config: dict[str, Any]) -> None:
+        """
+        Generates the maze with the algorithm selected by the GENERATOR key
+        of the config: "HUNT_AND_KILL" (the default), "ELLER", "KRUSKAL" or
+        "TILED".
+
+        When the maze is not perfect, the LOOP_DENSITY key gives the
+        fraction of the extra walls to remove (see add_loops()). Eller's
+        algorithm removes them while generating instead.
+
+        Args:
+            maze (Maze): The maze object to be modified.
+            config (dict): The configuration of the maze.
+        """
+        generator = config.get("GENERATOR", "HUNT_AND_KILL")
+        if generator == "ELLER":
+            self.eller(maze, config)
+            return
+        if generator == "KRUSKAL":
+            self.kruskal(maze, config)
+        elif generator == "TILED":
+            self.tiled(maze, config)
+        else:
+            self.hunt_and_kill(maze, config)
+
+        density = config.get("LOOP_DENSITY", 0.0)
+        if not config["PERFECT"] and density > 0:
+            removed = add_loops(maze, density, self.random)
+            self.observer.refresh(maze)
+            if self.profiler is not None:
+                self.profiler.count("loop_walls_removed", removed)
+
+    def kruskal(self, maze: Maze, config: dict[str, Any]) -> None:
+        """
+        Generates a perfect maze with the randomized Kruskal algorithm (see
+        carve_kruskal()). The whole maze is carved at once, so the observer
+        only sees the result.
+
+        Args:
+            maze (Maze): The maze object to be modified.
+            config (dict): The configuration of the maze, with the same
+                keys as for hunt_and_kill().
+        """
+        rng = self.seed_random(config)
+        self.observer.start(maze)
+        try:
+            carve_kruskal(maze, rng)
+            self.observer.refresh(maze)
+        finally:
+            self.observer.stop(maze)
+
+    def tiled(self, maze: Maze, config: dict[str, Any]) -> None:
+        """
+        Generates a perfect maze by tiles of TILE_SIZE x TILE_SIZE cells,
+        carved in a pool of processes then joined (see carve_tiled()). For
+        the same SEED and TILE_SIZE, the maze doesn't depend on the number
+        of processes.
+
+        Args:
+            maze (Maze): The maze object to be modified.
+            config (dict): The configuration of the maze, with the same
+                keys as for hunt_and_kill().
+        """
+        rng = self.seed_random(config)
+        self.observer.start(maze)
+        try:
+            tiles = carve_tiled(maze, rng, config.get("TILE_SIZE", TILE_SIZE),
+                                self.workers)
+            self.observer.refresh(maze)
+        finally:
+            self.observer.stop(maze)
+        if self.profiler is not None:
+            self.profiler.count("tiles", tiles)
+
+    def eller(self, maze: Maze, config: dict[str, Any]) -> None:
+        """
+        Generates the maze with Eller's algorithm (see get_eller_rows()),
+        carving it row by row into the maze object.
+
+        For the same config, the maze is the same as the one written by
+        stream_eller().
 
-    def __init__(self) -> None:
-        pass
+        Args:
+            maze (Maze): The maze object to be modified.
+            config (dict): The configuration of the maze, with the same
+                keys as for hunt_and_kill().
+        """
+        rng = self.seed_random(config)
+        observer = self.observer
+        rows = get_eller_rows(maze.width, maze.height, rng,
+                              config["PERFECT"],
+                              get_logo_cells(maze.width, maze.height),
+                              config.get("LOOP_DENSITY"))
+
+        def carve(cell: tuple[int, int]) -> None:
+            if maze.is_editable(cell):
+                maze.change_cell(cell, Cell.BLANK)
+                observer.cell_changed(maze, cell)
+
+        observer.start(maze)
+        try:
+            for r, (east, south) in enumerate(rows):
+                y = 2 * r + 1
+                for c in range(len(east)):
+                    x = 2 * c + 1
+                    carve((x, y))
+                    if not east[c]:
+                        carve((x + 1, y))
+                    if not south[c]:
+                        carve((x, y + 1))
+                observer.refresh(maze)
+        finally:
+            observer.stop(maze)
+
+    def stream_eller(self, config: dict[str, Any], filename: str) -> None:
+        """
+        Generates a maze with Eller's algorithm and writes it to a file one
+        row at a time, without ever building a Maze. Memory only depends on
+        the width, so mazes far bigger than the memory can be written.
+
+        Solving needs the whole maze, so the path line of the file is left
+        empty.
+
+        Args:
+            config (dict): The configuration of the maze.
+            filename (str): The name of the output file.
+        """
+        width = config["WIDTH"]
+        height = config["HEIGHT"]
+        logo = get_logo_cells(width, height)
+        if not logo:
+            print(f"{MazeError().__class__.__name__}: Can't draw 42 "
+                  "pattern.")
+        for key in ("ENTRY", "EXIT"):
+            if config[key] in logo:
+                print(f"Error: can't place {key.lower()}")
+                sys.exit(2)
+
+        rng = self.seed_random(config)
+        rows = get_eller_rows(width, height, rng, config["PERFECT"], logo,
+                              config.get("LOOP_DENSITY"))
+        put_rows_val(rows, filename, config["ENTRY"], config["EXIT"],
+                     level=config.get("COMPRESSION_LEVEL", DEFAULT_LEVEL))
 
     def hunt_and_kill(self, maze: Maze, config: dict[str, Any]) -> None:
         """
@@ -59,10 +255,16 @@ class Maze_Generator:
                 - "PERFECT" (bool): Whether to enforce\
                     a perfect maze structure.
                 - "SEED" (int, optional): Seed for the random number generator.
+                - "BULK_RANDOM" (bool, optional): Draw the random numbers
+                    in bulk instead of one by one (see bulk_choice()).
+                - "RECORD_TREE" (bool, optional): Record the spanning tree
+                    of a perfect maze in it, for SOLVER=TREE to solve it
+                    without any search (see Maze.get_tree()). False by
+                    default.
 
         Note:
-            - The function uses a `Live` object for\
-                real-time terminal rendering.
+            - Every carved cell is reported to `self.observer`, which may\
+                render it; the generation itself never draws anything.
             - Parity logic is used to handle specific\
                 constraints where the exit
             might be blocked or require special pathfinding rules.
@@ -78,10 +280,43 @@ class Maze_Generator:
         exit = config["EXIT"]
         cell = config["ENTRY"]
         perfect = config["PERFECT"]
+        observer = self.observer
 
         ex, ey = exit
         lock_coord = [(ex-1, ey-1), (ex+1, ey+1)]
 
+        grid = maze.grid
+        strict = CellCode.STRICT
+
+        # Hunt index: every hunted cell shares the parity of the entry, so
+        # only count, row by row, those which are neither visited nor
+        # strict. row_start remembers the first column still worth
+        # scanning and hunt_row the first row that is not finished yet;
+        # rows_scanned is the number of rows the last hunt went through.
+        start_x, start_y = config["ENTRY"]
+        offset_x = start_x % 2
+        offset_y = start_y % 2
+
+        row_left = [0] * height
+        row_start = [offset_x] * height
+        hunt_row = offset_y
+        rows_scanned = 0
+
+        # Spanning tree of a perfect maze, rooted at the entry: the move
+        # from its parent to every carved cell (see Maze.get_tree())
+        tree = bytearray(width * height) \
+            if perfect and config.get("RECORD_TREE", False) else None
+        root = start_y * width + start_x
+
+        def record(parent: tuple[int, int], cell: tuple[int, int]) -> None:
+            x, y = cell
+            i = y * width + x
+            if tree is None or tree[i] or i == root:
+                return
+            # Direction codes 1 to 4 for N, E, S and W, as in the solvers
+            px, py = parent
+            tree[i] = 1 if y < py else 3 if y > py else 2 if x > px else 4
+
         def is_parity_ok() -> bool:
 
             x, y = cell
@@ -147,26 +382,24 @@ class Maze_Generator:
 
                     if is_unvisited:
                         if (nx, ny) not in visited and\
-                             maze.maze[(nx, ny)] != Cell.STRICT and\
-                             maze.maze[(avg_x, avg_y)] != Cell.STRICT:
+                             grid[ny * width + nx] != strict and\
+                             grid[avg_y * width + avg_x] != strict:
                             valid_neighbors.append((nx, ny))
 
                     else:
                         if (nx, ny) in visited and\
-                             maze.maze[(avg_x, avg_y)] != Cell.STRICT:
+                             grid[avg_y * width + avg_x] != strict:
                             valid_neighbors.append((nx, ny))
 
             return valid_neighbors
 
-        def try_change_cell(maze: Maze, cell: tuple[int, int],
-                            live: Live) -> None:
+        def try_change_cell(maze: Maze, cell: tuple[int, int]) -> None:
             if (maze.is_editable(cell)):
                 maze.change_cell(cell, Cell.BLANK)
-                live.update(Text.from_ansi(maze.show_maze()))
-                time.sleep(0.02)
+                observer.cell_changed(maze, cell)
 
         def break_wall_between(cell1: tuple[int, int],
-                               cell2: tuple[int, int], live: Live) -> None:
+                               cell2: tuple[int, int]) -> None:
             x1, y1 = cell1
             x2, y2 = cell2
 
@@ -174,12 +407,15 @@ class Maze_Generator:
             wall_cell = ((x1 + x2) // 2, (y1 + y2) // 2)
 
             # And than we can change our path
-            try_change_cell(maze, wall_cell, live)
-            try_change_cell(maze, cell2, live)
+            try_change_cell(maze, wall_cell)
+            try_change_cell(maze, cell2)
+            if tree is not None:
+                record(cell1, wall_cell)
+                record(wall_cell, cell2)
 
         def exit_connected(maze: Maze, config: dict[str, Any],
-                           visited_cell: set[tuple[int, int]],
-                           live: Live) -> None:
+                           visited_cell: set[tuple[int, int]]) -> None:
+            nonlocal tree
             exit_node = config["EXIT"]
             x, y = exit_node
             direc = [(x, y-2), (x, y+2), (x-2, y), (x+2, y)]
@@ -211,15 +447,17 @@ class Maze_Generator:
                     try:
                         if (maze.maze[direction]) != Cell.STRICT and\
                            (maze.maze[direction]) != Cell.WALL:
-                            random_dir = random.choice(directions[direction])
+                            random_dir = choice(directions[direction])
                             maze.change_cell(random_dir, Cell.BLANK)
+                            # This may close a loop, the tree is dropped
+                            tree = None
                             return
                     except Exception:
                         pass
             else:
-                v_neigh = random.choice(neighbors)
-                break_wall_between(v_neigh, exit_node, live)
-                visited_cell.add(exit_node)
+                v_neigh = choice(neighbors)
+                break_wall_between(v_neigh, exit_node)
+                visit(exit_node, visited_cell)
 
         def is_exit_connected(maze: Maze, exit: tuple[int, int]) -> bool:
             x, y = exit
@@ -234,10 +472,23 @@ class Maze_Generator:
 
             return False
 
+        def visit(cell: tuple[int, int],
+                  visited_cell: set[tuple[int, int]]) -> None:
+            if cell in visited_cell:
+                return
+            visited_cell.add(cell)
+
+            # Keep the hunt index up to date
+            x, y = cell
+            if x % 2 == offset_x and y % 2 == offset_y and \
+               0 <= x < width and 0 <= y < height and \
+               grid[y * width + x] != strict:
+                row_left[y] -= 1
+
         def kill(current_cell: tuple[int, int],
-                 visited_cell: set[tuple[int, int]], live: Live) -> None:
+                 visited_cell: set[tuple[int, int]]) -> None:
 
-            visited_cell.add(current_cell)
+            visit(current_cell, visited_cell)
 
             while True:
                 neighbors = get_neighbors(current_cell, visited_cell, True)
@@ -245,45 +496,55 @@ class Maze_Generator:
                     break
 
                 # Choose a random destination
-                next_cell = random.choice(neighbors)
+                next_cell = choice(neighbors)
 
                 # Open a path between several path
-                break_wall_between(current_cell, next_cell, live)
+                break_wall_between(current_cell, next_cell)
 
                 # Move on the next
-                visited_cell.add(next_cell)
+                visit(next_cell, visited_cell)
                 current_cell = next_cell
 
-        def hunt(visited_cell: set[tuple[int, int]],
-                 live: Live) -> tuple[int, int] | None:
+        def hunt(visited_cell: set[tuple[int, int]]) -> tuple[int, int] | None:
+
+            nonlocal hunt_row, rows_scanned
+
+            # Rows above the cursor have nothing left to hunt
+            while hunt_row < height and row_left[hunt_row] == 0:
+                hunt_row += 2
+            rows_scanned = len(range(hunt_row, height, 2))
 
-            # Calculing parity of the algorithm
+            for y in range(hunt_row, height, 2):
+                if row_left[y] == 0:
+                    continue
 
-            start_x, start_y = config["ENTRY"]
-            offset_x = start_x % 2
-            offset_y = start_y % 2
+                # Skip the visited prefix of the row once and for all
+                start = row_start[y]
+                while start < width and ((start, y) in visited_cell or
+                                         grid[y * width + start] == strict):
+                    start += 2
+                row_start[y] = start
 
-            for y in range(offset_y, height, 2):
-                for x in range(offset_x, width, 2):
+                for x in range(start, width, 2):
                     cell = (x, y)
 
                     if cell not in visited_cell\
-                       and maze.maze[cell] != Cell.STRICT:
+                       and grid[y * width + x] != strict:
 
                         neighbors = get_neighbors(cell, visited_cell, False)
                         if neighbors:
-                            v_neigh = random.choice(neighbors)
-                            break_wall_between(v_neigh, cell, live)
+                            v_neigh = choice(neighbors)
+                            break_wall_between(v_neigh, cell)
+                            rows_scanned = (y - hunt_row) // 2 + 1
                             return cell
             return None
 
         # Get the seed
-        try:
-            random.seed(config["SEED"])
-        except Exception:
-            seed = random.randint(0, 314159265358979)
-            config["RANDOM_SEED"] = seed
-            random.seed(config["RANDOM_SEED"])
+        rng = self.seed_random(config)
+        if config.get("BULK_RANDOM", False):
+            choice = bulk_choice(rng)
+        else:
+            choice = rng.choice
 
         # Initialization of visited cells
         visited_cell = set()
@@ -297,15 +558,89 @@ class Maze_Generator:
                 visited_cell.add(lock_coord[0])
                 visited_cell.add(lock_coord[1])
 
-        with Live("", refresh_per_second=25) as live:
-
+        # Fill the hunt index
+        for y in range(offset_y, height, 2):
+            row_left[y] = sum(1 for x in range(offset_x, width, 2)
+                              if (x, y) not in visited_cell and
+                              grid[y * width + x] != strict)
+
+        # Profiling only wraps the helpers, so it costs nothing when off
+        walk, search = kill, hunt
+        profiler = self.profiler
+        if profiler is not None:
+            get_neighbors = profiler.counted("neighbor_lookups", get_neighbors)
+            observer = CountingObserver(observer, profiler)
+
+            def profiled_kill(current_cell: tuple[int, int],
+                              visited_cell: set[tuple[int, int]]) -> None:
+                before = len(visited_cell)
+                kill(current_cell, visited_cell)
+                profiler.count("kill_walks")
+                profiler.count("kill_steps", len(visited_cell) - before - 1)
+
+            def profiled_hunt(visited_cell: set[tuple[int, int]]
+                              ) -> tuple[int, int] | None:
+                found = hunt(visited_cell)
+                profiler.count("hunts")
+                profiler.count("hunt_rows_scanned", rows_scanned)
+                return found
+
+            walk, search = profiled_kill, profiled_hunt
+
+        observer.start(maze)
+        try:
             while (cell is not None):
-                kill(cell, visited_cell, live)
-                cell = hunt(visited_cell, live)
-
-                maze_render = Text.from_ansi(maze.show_maze())
-                live.update(maze_render)
+                walk(cell, visited_cell)
+                cell = search(visited_cell)
+                observer.refresh(maze)
 
             if not is_exit_connected(maze, exit):
-                exit_connected(maze, config, visited_cell, live)
-            live.update(Text.from_ansi(maze.show_maze()))
+                exit_connected(maze, config, visited_cell)
+            if tree is not None:
+                maze.set_tree(tree)
+        finally:
+            observer.stop(maze)
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+def bulk_choice(rng: random.Random,
+                size: int = 4096) -> Callable[[Sequence[T]], T]:
+    """
+    Returns a choice() function that draws its random numbers from a
+    buffer of bytes filled in bulk by rng.
+
+    random.choice() costs a few Python calls per draw, which is most of a
+    kill step. Here one randbytes() call serves thousands of steps, and a
+    step only reads the next byte. Bytes that would favor some choices
+    (255 for 3 neighbors) are skipped, so every choice stays uniform. The
+    draws only depend on the seed of rng, so the maze is still
+    reproducible, but it differs from the one random.choice() carves.
+
+    Args:
+        rng (random.Random): The seeded generator to draw from.
+        size (int): Number of bytes drawn at once.
+
+    Returns:
+        Callable: A replacement for rng.choice() on sequences of at most
+        256 elements.
+    """
+    buffer = b""
+    pos = 0
+
+    def choice(seq: Sequence[T]) -> T:
+        nonlocal buffer, pos
+        count = len(seq)
+        limit = 256 - 256 % count
+        while True:
+            if pos == len(buffer):
+                buffer = rng.randbytes(size)
+                pos = 0
+            byte = buffer[pos]
+            pos += 1
+            if byte < limit:
+                return seq[byte % count]
+
+    return choice
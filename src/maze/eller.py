@@ -0,0 +1,332 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  eller.py                                          :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 15:20:37 by alebaron        #+#    #+#               #
+#  Updated: 2026/10/18 15:20:37 by alebaron        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from typing import Iterator, Iterable
+import random
+
+
+# +-------------------------------------------------------------------------+
+# |                                Variable                                 |
+# +-------------------------------------------------------------------------+
+
+# A random byte below this value joins two cells of a row (one in two)
+JOIN_CHANCE = 128
+
+# In imperfect mazes, a random byte below this value also opens a wall
+# between two cells already connected, which creates a loop
+LOOP_CHANCE = 8
+
+
+# +-------------------------------------------------------------------------+
+# |                                 Class                                   |
+# +-------------------------------------------------------------------------+
+
+class RowWalls:
+    """
+    Tells which walls of a row of cells can be opened, given the strict
+    region (the logo) of the grid.
+
+    The cells are the ones of the output file: (1, 1), (3, 1), ... in grid
+    coordinates, the grid cells between them being their walls. Cell c of
+    row r is therefore the grid cell (2c + 1, 2r + 1).
+
+    Attributes:
+        cols (int): Number of cells in a row.
+        rows (int): Number of rows of cells.
+        strict_rows (dict[int, set[int]]): For each grid row crossed by
+            the strict region, the grid columns it covers.
+
+    Methods:
+        get(self, r: int) -> tuple[bytearray, bytearray, bytearray]:
+            Returns the closed cells of a row and the flags of the eastern
+            and southern walls which can be opened.
+
+        get_segments(self, can_east: bytearray,
+                     closed: bytearray) -> list[range]:
+            Splits a row into the runs of cells that can be joined.
+
+        get_sinks(self) -> dict[int, bytearray]:
+            Finds, for the rows around the strict region, the cells from
+            which the last row can be reached without going up.
+    """
+
+    def __init__(self, width: int, height: int,
+                 strict: Iterable[tuple[int, int]]) -> None:
+        self.cols = (width - 1) // 2
+        self.rows = (height - 1) // 2
+        self.strict_rows: dict[int, set[int]] = {}
+        for x, y in strict:
+            self.strict_rows.setdefault(y, set()).add(x)
+
+    def get_closed(self, y: int) -> bytearray:
+        closed = bytearray(self.cols)
+        for x in self.strict_rows.get(y, ()):
+            if x % 2 == 1 and x // 2 < self.cols:
+                closed[x // 2] = 1
+        return closed
+
+    def get(self, r: int) -> tuple[bytearray, bytearray, bytearray]:
+        cols = self.cols
+        y = 2 * r + 1
+        last = r == self.rows - 1
+        closed = self.get_closed(y)
+        next_closed = self.get_closed(y + 2)
+
+        can_east = bytearray(b"\x01") * cols
+        can_east[-1] = 0
+        can_south = bytearray(b"\x01" if not last else b"\x00") * cols
+        if y in self.strict_rows or y + 1 in self.strict_rows or \
+           y + 2 in self.strict_rows:
+            for c in range(cols):
+                if closed[c]:
+                    can_east[c] = can_south[c] = 0
+                    if c > 0:
+                        can_east[c - 1] = 0
+                if next_closed[c]:
+                    can_south[c] = 0
+            for x in self.strict_rows.get(y, ()):
+                if x % 2 == 0 and 0 < x // 2 <= cols:
+                    can_east[x // 2 - 1] = 0
+            for x in self.strict_rows.get(y + 1, ()):
+                if x % 2 == 1 and x // 2 < cols:
+                    can_south[x // 2] = 0
+        return closed, can_east, can_south
+
+    def get_segments(self, can_east: bytearray,
+                     closed: bytearray) -> list[range]:
+        segments = []
+        start = 0
+        for c in range(self.cols):
+            if not can_east[c]:
+                if not closed[c]:
+                    segments.append(range(start, c + 1))
+                start = c + 1
+        return segments
+
+    def get_sinks(self) -> dict[int, bytearray]:
+        """
+        Eller's algorithm keeps every set alive by sending it down, until
+        the last row joins them all. Around the strict region, some runs of
+        cells can't go down anymore: their sets would be cut from the
+        others. This finds, from the bottom, which cells can still reach
+        the last row. When the strict region cuts the last row itself, only
+        its longest run counts.
+
+        Only the rows around the strict region are returned, every cell of
+        the other rows can reach the last row.
+
+        Returns:
+            dict[int, bytearray]: For each row index, 1 for every cell from
+            which the last row can be reached, else 0.
+        """
+        rows_with_strict = {(y - 1) // 2 for y in self.strict_rows}
+        if not rows_with_strict:
+            return {}
+        top = max(min(rows_with_strict) - 1, 0)
+        bottom = min(max(rows_with_strict) + 1, self.rows - 1)
+        if bottom < self.rows - 1:
+            below = bytearray(b"\x01") * self.cols
+        else:
+            below = bytearray(self.cols)
+
+        sinks: dict[int, bytearray] = {}
+        for r in range(bottom, top - 1, -1):
+            closed, can_east, can_south = self.get(r)
+            sink = bytearray(self.cols)
+            segments = self.get_segments(can_east, closed)
+            if r == self.rows - 1:
+                alive = [max(segments, key=len)] if segments else []
+            else:
+                alive = [segment for segment in segments
+                         if any(can_south[c] and below[c]
+                                for c in segment)]
+            for segment in alive:
+                for c in segment:
+                    sink[c] = 1
+            sinks[r] = sink
+            below = sink
+        return sinks
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+def get_eller_rows(width: int, height: int, rng: random.Random,
+                   perfect: bool, strict: Iterable[tuple[int, int]],
+                   loop_density: float | None = None
+                   ) -> Iterator[tuple[bytearray, bytearray]]:
+    """
+    Generates a maze with Eller's algorithm, one row of cells at a time.
+
+    Only the current row is kept: each cell knows the set of cells it is
+    already connected to, through the rows above. Neighbouring cells of
+    different sets are randomly joined, then every set opens at least one
+    wall toward the next row, so that no set gets cut from the others. The
+    last row joins every remaining set.
+
+    Cells and walls of the strict region (the logo) are never opened.
+    Around it, a set only counts the walls leading to cells which can
+    still reach the last row (see RowWalls.get_sinks()), and joins its
+    neighbours when it has none. The runs of cells that can't are dead
+    ends: each of them gets a wall opened from the row above.
+
+    Args:
+        width (int): Width of the grid.
+        height (int): Height of the grid.
+        rng (random.Random): The seeded generator to draw from.
+        perfect (bool): If False, a few walls between cells that are
+            already connected are opened too, creating loops.
+        strict (Iterable): Grid coordinates of the strict region.
+        loop_density (float | None): Probability to open such a wall, in
+            imperfect mazes (LOOP_CHANCE / 256 by default).
+
+    Returns:
+        Iterator: For each row of cells, the 0/1 flags of the eastern and
+        southern walls of its cells.
+    """
+
+    walls = RowWalls(width, height, strict)
+    cols = walls.cols
+    rows = walls.rows
+    if cols == 0 or rows == 0:
+        return
+    sinks = walls.get_sinks()
+    loop_chance = LOOP_CHANCE
+    if loop_density is not None:
+        loop_chance = round(loop_density * 256)
+    everywhere = bytearray(b"\x01") * cols
+
+    parent = list(range(cols))
+
+    def find(label: int) -> int:
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    closed, can_east, can_south = walls.get(0)
+    labels = [-1 if closed[c] else c for c in range(cols)]
+
+    for r in range(rows):
+        last = r == rows - 1
+
+        # Join neighbouring sets
+        east = bytearray(b"\x01") * cols
+        draws = rng.randbytes(cols)
+        for c in range(cols - 1):
+            if not can_east[c]:
+                continue
+            a = find(labels[c])
+            b = find(labels[c + 1])
+            if a != b:
+                if last or draws[c] < JOIN_CHANCE:
+                    parent[b] = a
+                    east[c] = 0
+            elif not perfect and draws[c] < loop_chance:
+                east[c] = 0
+
+        south = bytearray(b"\x01") * cols
+        if last:
+            yield east, south
+            return
+
+        # Open some walls toward the next row, at least one per set that
+        # leads to a cell which can reach the last row
+        below = sinks.get(r + 1, everywhere)
+        has_down = bytearray(cols)
+        draws = rng.randbytes(cols)
+        for c in range(cols):
+            if can_south[c] and draws[c] < JOIN_CHANCE:
+                south[c] = 0
+                if below[c]:
+                    has_down[find(labels[c])] = 1
+
+        changed = True
+        while changed:
+            changed = False
+            stuck: dict[int, list[int]] = {}
+            for c in range(cols):
+                if labels[c] >= 0:
+                    root = find(labels[c])
+                    if not has_down[root]:
+                        stuck.setdefault(root, []).append(c)
+
+            for root, cells in stuck.items():
+                choices = [c for c in cells if can_south[c] and below[c]]
+                if choices:
+                    c = choices[rng.randrange(len(choices))]
+                    south[c] = 0
+                    has_down[root] = 1
+                    continue
+
+                # Nowhere to go: join a neighbouring set instead
+                for c in cells:
+                    for wall in (c - 1, c):
+                        if wall < 0 or not can_east[wall] or \
+                           not east[wall]:
+                            continue
+                        a = find(labels[wall])
+                        b = find(labels[wall + 1])
+                        if a != b:
+                            parent[b] = a
+                            has_down[a] |= has_down[b]
+                            east[wall] = 0
+                            changed = True
+                            break
+                    if changed:
+                        break
+                if changed:
+                    break
+
+        next_closed, next_east, next_south = walls.get(r + 1)
+
+        # Dead ends of the next row can only be reached from this one
+        if below is not everywhere:
+            for segment in walls.get_segments(next_east, next_closed):
+                if below[segment[0]] or \
+                   any(not south[c] for c in segment):
+                    continue
+                choices = [c for c in segment if can_south[c]]
+                if choices:
+                    south[choices[rng.randrange(len(choices))]] = 0
+
+        yield east, south
+
+        # Cells below an opened wall stay in their set, the others start a
+        # new one. Labels are renumbered to stay below cols.
+        remap = [-1] * cols
+        count = 0
+        for c in range(cols):
+            if not south[c]:
+                root = find(labels[c])
+                if remap[root] == -1:
+                    remap[root] = count
+                    count += 1
+        next_labels = [-1] * cols
+        for c in range(cols):
+            if next_closed[c]:
+                continue
+            if not south[c]:
+                next_labels[c] = remap[find(labels[c])]
+            else:
+                next_labels[c] = count
+                count += 1
+
+        parent[:] = range(cols)
+        labels = next_labels
+        closed, can_east, can_south = next_closed, next_east, next_south
@@ -0,0 +1,267 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  kruskal.py                                        :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 17:41:09 by tcolson         #+#    #+#               #
+#  Updated: 2026/10/18 17:41:09 by tcolson         ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from .Maze import Maze, CellCode, OPEN_TABLE
+import random
+
+
+# +-------------------------------------------------------------------------+
+# |                                Variable                                 |
+# +-------------------------------------------------------------------------+
+
+# bytes.translate() table: wall -> blank (every other code is kept)
+CARVE_TABLE = bytes(CellCode.BLANK if code == CellCode.WALL else code
+                    for code in range(256))
+
+
+# +-------------------------------------------------------------------------+
+# |                                 Class                                   |
+# +-------------------------------------------------------------------------+
+
+class DisjointSet:
+    """
+    Union-find over the integers 0 to size - 1, with path halving, so that
+    a sequence of operations runs in almost linear time.
+
+    Attributes:
+        parent (list[int]): Parent of each element, roots are their own.
+
+    Methods:
+        find(self, item: int) -> int:
+            Returns the root of the set of an element.
+
+        union(self, a: int, b: int) -> bool:
+            Merges the sets of two elements. Returns False if they were
+            already in the same set.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> bool:
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return False
+        self.parent[b] = a
+        return True
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+def carve_kruskal(maze: Maze, rng: random.Random) -> None:
+    """
+    Generates a perfect maze with the randomized Kruskal algorithm.
+
+    The cells are the ones of the output file: (1, 1), (3, 1), ... in grid
+    coordinates. They are all opened at once, then every wall between two
+    of them is visited in a random order and opened when it joins two
+    cells that are not connected yet. Cells and walls of the strict region
+    (the logo) are never opened.
+
+    Args:
+        maze (Maze): The maze to carve, full of walls.
+        rng (random.Random): The seeded generator to draw from.
+    """
+
+    width = maze.width
+    grid = maze.grid
+    cols = (width - 1) // 2
+    rows = (maze.height - 1) // 2
+
+    open_cells(maze)
+    edges = get_edges(cols, rows)
+
+    # Only the few walls around the logo can't be opened
+    banned = get_banned_walls(maze)
+    if banned:
+        edges = [edge for edge in edges if edge not in banned]
+    rng.shuffle(edges)
+
+    # Same as DisjointSet, inlined: this loop runs once per wall
+    parent = list(range(cols * rows))
+    for edge in edges:
+        a = edge >> 1
+        b = a + cols if edge & 1 else a + 1
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a == b:
+            continue
+        parent[b] = a
+        r, c = divmod(edge >> 1, cols)
+        if edge & 1:
+            grid[(2 * r + 2) * width + 2 * c + 1] = CellCode.BLANK
+        else:
+            grid[(2 * r + 1) * width + 2 * c + 2] = CellCode.BLANK
+
+    maze.touch_all()
+
+
+def open_cells(maze: Maze) -> None:
+    """
+    Opens every cell of the output file: (1, 1), (3, 1), ... in grid
+    coordinates. The logo, the entry and the exit keep their code.
+
+    Args:
+        maze (Maze): The maze to carve, full of walls.
+    """
+
+    width = maze.width
+    grid = maze.grid
+    cols = (width - 1) // 2
+    for r in range((maze.height - 1) // 2):
+        start = (2 * r + 1) * width + 1
+        cells = slice(start, start + 2 * cols - 1, 2)
+        grid[cells] = grid[cells].translate(CARVE_TABLE)
+
+
+def get_edges(cols: int, rows: int) -> list[int]:
+    """
+    Lists the walls between two cells of a cols x rows lattice, row by
+    row: 2 * cell for the wall east of a cell, 2 * cell + 1 for the wall
+    south of it.
+
+    Args:
+        cols (int): Number of cells in a row.
+        rows (int): Number of rows of cells.
+
+    Returns:
+        list[int]: The walls.
+    """
+
+    edges: list[int] = []
+    for r in range(rows):
+        first = 2 * r * cols
+        edges.extend(range(first, first + 2 * cols - 2, 2))
+        if r + 1 < rows:
+            edges.extend(range(first + 1, first + 2 * cols, 2))
+    return edges
+
+
+def get_banned_walls(maze: Maze) -> set[int]:
+    """
+    Returns the walls (numbered as in get_edges()) that must never be
+    opened: the walls of the strict region (the logo), and the four walls
+    of its cells.
+
+    Args:
+        maze (Maze): The maze.
+
+    Returns:
+        set[int]: The walls to keep.
+    """
+
+    width = maze.width
+    grid = maze.grid
+    cols = (width - 1) // 2
+    strict = CellCode.STRICT
+
+    banned: set[int] = set()
+    i = grid.find(strict)
+    while i != -1:
+        y, x = divmod(i, width)
+        c, r = x // 2, y // 2
+        if x % 2 and y % 2:
+            # A logo cell: none of its four walls
+            cell = r * cols + c
+            banned.update((2 * cell, 2 * cell + 1,
+                           2 * cell - 2, 2 * (cell - cols) + 1))
+        elif y % 2:
+            banned.add(2 * (r * cols + c - 1))
+        elif x % 2:
+            banned.add(2 * ((r - 1) * cols + c) + 1)
+        i = grid.find(strict, i + 1)
+    return banned
+
+
+def add_loops(maze: Maze, density: float, rng: random.Random) -> int:
+    """
+    Removes a fraction of the walls that close a loop, and makes sure every
+    open cell is connected.
+
+    A first pass puts every pair of cells joined by an open passage in the
+    same set. A second one visits the remaining walls between two open
+    cells: a wall between two sets is always removed, which connects
+    them, and a wall inside a set (removing it creates a loop) is removed
+    with the given probability. The cells are the ones of the lattice of
+    the entry, like in hunt_and_kill(). Only walls are removed: the strict
+    region, the entry and the exit are never changed.
+
+    Args:
+        maze (Maze): The generated maze.
+        density (float): Fraction of the extra walls to remove (0 to 1).
+        rng (random.Random): The seeded generator to draw from.
+
+    Returns:
+        int: The number of removed walls.
+    """
+
+    width = maze.width
+    height = maze.height
+    grid = maze.grid
+    is_open = grid.translate(OPEN_TABLE)
+    xs = range(maze.entry[0] % 2, width, 2)
+    ys = range(maze.entry[1] % 2, height, 2)
+    cols = len(xs)
+    wall = CellCode.WALL
+    draw = rng.random
+
+    sets = DisjointSet(cols * len(ys))
+    for r, y in enumerate(ys):
+        for c, x in enumerate(xs):
+            i = y * width + x
+            if not is_open[i]:
+                continue
+            cell = r * cols + c
+            if x + 2 < width and is_open[i + 1] and is_open[i + 2]:
+                sets.union(cell, cell + 1)
+            if y + 2 < height and is_open[i + width] and \
+               is_open[i + 2 * width]:
+                sets.union(cell, cell + cols)
+
+    removed = 0
+    for r, y in enumerate(ys):
+        for c, x in enumerate(xs):
+            i = y * width + x
+            if not is_open[i]:
+                continue
+            cell = r * cols + c
+            if x + 2 < width and grid[i + 1] == wall and is_open[i + 2]:
+                if sets.union(cell, cell + 1) or draw() < density:
+                    grid[i + 1] = CellCode.BLANK
+                    maze.touch(i + 1)
+                    removed += 1
+            if y + 2 < height and grid[i + width] == wall and \
+               is_open[i + 2 * width]:
+                if sets.union(cell, cell + cols) or draw() < density:
+                    grid[i + width] = CellCode.BLANK
+                    maze.touch(i + width)
+                    removed += 1
+    return removed
@@ -0,0 +1,58 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  observer.py                                       :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 10:12:41 by alebaron        #+#    #+#               #
+#  Updated: 2026/10/18 10:12:41 by alebaron        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from .Maze import Maze
+
+
+# +-------------------------------------------------------------------------+
+# |                                 Class                                   |
+# +-------------------------------------------------------------------------+
+
+class MazeObserver:
+    """
+    Base class for everything that wants to follow a generation or a
+    resolution while it happens (terminal animation, progress bar, ...).
+
+    The generator and the solver only talk to this interface, so they can
+    run headless without any rendering library. Every method does nothing
+    by default: subclasses override the ones they need.
+
+    Methods:
+        start(self, maze: Maze) -> None:
+            Called once before the maze starts changing.
+
+        cell_changed(self, maze: Maze, cell: tuple[int, int]) -> None:
+            Called after each animated cell change.
+
+        refresh(self, maze: Maze) -> None:
+            Called when a whole step is over and the maze can be redrawn.
+
+        stop(self, maze: Maze) -> None:
+            Called once when the work is over, even on error.
+    """
+
+    def start(self, maze: Maze) -> None:
+        pass
+
+    def cell_changed(self, maze: Maze, cell: tuple[int, int]) -> None:
+        pass
+
+    def refresh(self, maze: Maze) -> None:
+        pass
+
+    def stop(self, maze: Maze) -> None:
+        pass
@@ -15,11 +15,13 @@
 # +-------------------------------------------------------------------------+
 
 
-from .Maze import Maze, Cell
-from rich.live import Live
-from rich.text import Text
-from time import sleep
-from typing import Optional, Any
+from .Maze import Maze, Cell, CellCode, OPEN_TABLE
+from .observer import MazeObserver
+from src.utils.profiler import Profiler
+from typing import Optional, Any, Callable
+from collections import deque
+from array import array
+import heapq
 
 
 # +-------------------------------------------------------------------------+
@@ -27,17 +29,26 @@ from typing import Optional, Any
 # +-------------------------------------------------------------------------+
 
 
-def resolution(maze: Maze, config: dict[str, Any]) -> str:
+def resolution(maze: Maze, config: dict[str, Any],
+               observer: Optional[MazeObserver] = None,
+               profiler: Optional[Profiler] = None) -> str:
     """
-    Find the shortest path through the maze using a recursive backtracking
-    algorithm.
+    Find a path through the maze with the solver selected by the config.
 
-    This function explores the maze starting from the entry point defined in
-    the config.
-    It can visually animate the solving process using the 'Live' display if
-    enabled.
-    The exploration order is optimized by prioritizing directions that lead
-    toward the exit coordinates.
+    "BFS" (the default), "ASTAR" and "BIBFS" (a bidirectional BFS) are
+    iterative and always return a shortest path, even in imperfect mazes.
+    "TREE" reads the path of a perfect maze in the spanning tree recorded
+    by its generator, without any search (see solve_tree()), and falls
+    back to "BFS" when there is no tree to trust.
+    "BACKTRACKING" is the original recursive algorithm: it explores the
+    maze starting from the entry point, prioritizing directions that lead
+    toward the exit coordinates, and is limited by the recursion depth of
+    Python.
+    When the path is shown, every cell of the path (every explored cell for
+    "BACKTRACKING") is reported to the observer, which can animate the
+    solving process.
+    The solution is cached in the maze: as long as its walls don't change,
+    solving it again with the same solver only marks the cached path.
 
     Args:
         maze (Maze): The maze object containing the grid and cell manipulation
@@ -47,30 +58,71 @@ def resolution(maze: Maze, config: dict[str, Any]) -> str:
             - "HEIGHT" (int): Grid height.
             - "EXIT" (tuple): Exit coordinates (x, y).
             - "ENTRY" (tuple): Starting coordinates (x, y).
-            - "HIDE" (bool): If False, animates the solving process.
+            - "HIDE" (bool): If False, the path is kept in the maze and the
+              solving process is reported to the observer.
+            - "SOLVER" (str, optional): "BFS", "ASTAR", "BIBFS", "TREE" or
+              "BACKTRACKING".
+        observer (Optional[MazeObserver]): Follows the solving process.
+        profiler (Optional[Profiler]): Receives the number of expanded
+            cells as "solver_nodes_expanded", the number of cached
+            solutions used as "solution_cache_hits" and the number of paths
+            read from a spanning tree as "tree_solutions".
 
     Returns:
         str: A string of directions (e.g., "NSSWEE") representing the path from
              start to finish.
     """
 
+    solver = config.get("SOLVER", "BFS")
+    cached = maze.get_solution(solver)
+    if cached is not None:
+        if profiler is not None:
+            profiler.count("solution_cache_hits")
+        found, cells = cached
+        if not config["HIDE"]:
+            show_path(maze, cells, observer)
+        return found
+
+    if solver in SOLVERS or solver == "TREE":
+        stats: Optional[dict[str, int]] = None
+        if profiler is not None:
+            stats = {}
+        tree_path = None
+        if solver == "TREE":
+            tree_path = solve_tree(maze, config["ENTRY"], config["EXIT"])
+        if tree_path is not None:
+            found = tree_path
+            if profiler is not None:
+                profiler.count("tree_solutions")
+        else:
+            found = SOLVERS.get(solver, solve_bfs)(
+                maze, config["ENTRY"], config["EXIT"], stats)
+        if stats is not None and "nodes_expanded" in stats \
+                and profiler is not None:
+            profiler.count("solver_nodes_expanded", stats["nodes_expanded"])
+        cells = get_path_cells(maze.width, config["ENTRY"], found)
+        maze.set_solution(solver, found, cells)
+        if not config["HIDE"]:
+            show_path(maze, cells, observer)
+        return found
+
     width = config["WIDTH"]
     height = config["HEIGHT"]
+    grid = maze.grid
     path = ""
 
-    def explore_cell(cell: tuple[int, int], live: Optional[Live]) -> None:
+    def explore_cell(cell: tuple[int, int],
+                     observer: Optional[MazeObserver]) -> None:
         """
-        Mark a cell as part of the current path and refresh the UI.
+        Mark a cell as part of the current path and notify the observer.
 
         Args:
             cell (tuple): The (x, y) coordinates to mark.
-            live (Optional[Live]): The Live display object for
-                real-time rendering.
+            observer (Optional[MazeObserver]): Follows the solving process.
         """
         maze.change_cell(cell, Cell.SOLVE)
-        if live:
-            live.update(Text.from_ansi(maze.show_maze()))
-            sleep(0.05)
+        if observer:
+            observer.cell_changed(maze, cell)
 
     def get_directions(pos: tuple[int, int]) -> list[tuple[int, int]]:
         """
@@ -136,7 +188,8 @@ def resolution(maze: Maze, config: dict[str, Any]) -> str:
                     directions.append((x, y+1))
         return directions
 
-    def solve(pos: tuple[int, int], live: Optional[Live]) -> bool:
+    def solve(pos: tuple[int, int],
+              observer: Optional[MazeObserver]) -> bool:
         """
         Recursively explore the maze to find the exit.
 
@@ -145,8 +198,7 @@ def resolution(maze: Maze, config: dict[str, Any]) -> str:
 
         Args:
             pos (tuple): Current (x, y) position.
-            live (Optional[Live]): The Live display object for real-time
-            rendering.
+            observer (Optional[MazeObserver]): Follows the solving process.
 
         Returns:
             bool: True if the exit was found from this branch, False otherwise.
@@ -161,7 +213,8 @@ def resolution(maze: Maze, config: dict[str, Any]) -> str:
             if nx > width - 1 or nx < 0 or ny > height - 1 or ny < 0:
                 pass
             else:
-                if maze.maze[newpos] == Cell.EXIT:
+                code = grid[ny * width + nx]
+                if code == CellCode.EXIT:
                     if newpos == (x, y-1):
                         path += "N"
                     if newpos == (x, y+1):
@@ -171,9 +224,9 @@ def resolution(maze: Maze, config: dict[str, Any]) -> str:
                     if newpos == (x+1, y):
                         path += "E"
                     return True
-                elif maze.maze[newpos] == Cell.BLANK:
-                    explore_cell(newpos, live)
-                    res = solve(newpos, live)
+                elif code == CellCode.BLANK:
+                    explore_cell(newpos, observer)
+                    res = solve(newpos, observer)
                     if res:
                         if newpos == (x, y-1):
                             path += "N"
@@ -188,16 +241,435 @@ def resolution(maze: Maze, config: dict[str, Any]) -> str:
                         maze.change_cell(newpos, Cell.BLANK)
         return False
 
+    if profiler is not None:
+        solve = profiler.counted("solver_nodes_expanded", solve)
+
     # Start to solve, stop when finding the exit
 
     if not config["HIDE"]:
-        with Live("", refresh_per_second=25) as live:
-
-            solve(config["ENTRY"], live)
-
-            maze_render = Text.from_ansi(maze.show_maze())
-            live.update(maze_render)
+        if observer:
+            observer.start(maze)
+        try:
+            solve(config["ENTRY"], observer)
+        finally:
+            if observer:
+                observer.stop(maze)
     else:
         solve(config["ENTRY"], None)
         maze.clean_path()
-    return path[::-1]
+    path = path[::-1]
+    maze.set_solution(solver, path,
+                      get_path_cells(width, config["ENTRY"], path))
+    return path
+
+
+# +-------------------------------------------------------------------------+
+# |                            Iterative solvers                            |
+# +-------------------------------------------------------------------------+
+
+# Cells a path can go through, indexed by CellCode
+WALKABLE = bytes(code in (CellCode.BLANK, CellCode.SOLVE, CellCode.EXIT)
+                 for code in range(256))
+
+# Direction codes stored in the parent buffer are 1 (N), 2 (E), 3 (S) and
+# 4 (W); 0 means not reached yet. This table turns them into letters.
+DIRECTION_LETTERS = bytes(b" NESW").ljust(256, b" ")
+
+# bytes.translate() table: direction code -> code of the opposite move
+REVERSE_CODES = bytes((0, 3, 4, 1, 2)).ljust(256, b"\0")
+
+# Codes stored by solve_bibfs() for a move N, E, S and W: the move itself
+# on the entry side, the move back on the exit side
+SIDE_CODES = ((1, 2, 3, 4), (3, 4, 1, 2))
+
+
+def trace_path(came_from: bytearray, start: int, goal: int,
+               width: int) -> str:
+    """
+    Rebuild the path from the parent buffer filled by a search.
+
+    Each reached cell stores the direction of the move that reached it, so
+    walking back from the goal only needs to undo those moves.
+
+    Args:
+        came_from (bytearray): Direction code (1-4) of every reached cell.
+        start (int): Index of the starting cell.
+        goal (int): Index of the reached goal.
+        width (int): Width of the grid.
+
+    Returns:
+        str: The N/E/S/W directions from start to goal.
+    """
+    back = (0, width, -1, -width, 1)
+    steps = bytearray()
+    i = goal
+    while i != start:
+        direction = came_from[i]
+        steps.append(direction)
+        i += back[direction]
+    steps.reverse()
+    return steps.translate(DIRECTION_LETTERS).decode()
+
+
+def solve_tree(maze: Maze, entry: tuple[int, int],
+               exit: tuple[int, int]) -> Optional[str]:
+    """
+    Find the path of a perfect maze in the spanning tree recorded by its
+    generator (see Maze.get_tree()), without any search.
+
+    Both ends are walked up the tree to their common ancestor: the path
+    climbs from the entry to it, then goes down to the exit. The entry is
+    the root of the tree of hunt_and_kill(), so only the exit is walked up
+    and the cost is the length of the path. In a perfect maze it is the only
+    path, so the shortest one. Every cell of the path is checked to be open.
+    An exit left on a wall between two cells is reached from the closest of
+    its neighbours.
+
+    Args:
+        maze (Maze): The maze to solve.
+        entry (tuple): Starting coordinates (x, y).
+        exit (tuple): Exit coordinates (x, y).
+
+    Returns:
+        Optional[str]: The N/E/S/W directions from entry to exit, or None
+        if the maze has no tree for its walls, or if they don't meet in it.
+    """
+    tree = maze.get_tree()
+    if tree is None:
+        return None
+    width = maze.width
+    grid = maze.grid
+    back = (0, width, -1, -width, 1)
+    start = entry[1] * width + entry[0]
+    goal = exit[1] * width + exit[0]
+
+    # The ancestors of the entry, with the number of moves up to them
+    climbs = bytearray()
+    ancestors = {start: 0}
+    i = start
+    while tree[i]:
+        climbs.append(tree[i])
+        i += back[tree[i]]
+        if not OPEN_TABLE[grid[i]] or i in ancestors:
+            return None
+        ancestors[i] = len(climbs)
+
+    def descend(i: int, last: bytes) -> Optional[bytearray]:
+        # The moves from the entry down to the cell i, then the last ones
+        descents = bytearray(last)
+        while i not in ancestors:
+            if not tree[i] or not OPEN_TABLE[grid[i]] or \
+               len(descents) > len(tree):
+                return None
+            descents.append(tree[i])
+            i += back[tree[i]]
+        descents.reverse()
+        return climbs[:ancestors[i]].translate(REVERSE_CODES) + descents
+
+    steps = descend(goal, b"")
+    if steps is None and not tree[goal]:
+        # An exit on the wall between two cells is never carved: the path
+        # ends with a move from the closest of its open neighbours
+        x = goal % width
+        paths = [descend(n, bytes((direction,)))
+                 for n, direction, possible in (
+                     (goal - width, 3, goal >= width),
+                     (goal + 1, 4, x != width - 1),
+                     (goal + width, 1, goal < len(grid) - width),
+                     (goal - 1, 2, x != 0))
+                 if possible and OPEN_TABLE[grid[n]]]
+        steps = min((path for path in paths if path is not None), key=len,
+                    default=None)
+    if steps is None:
+        return None
+    return steps.translate(DIRECTION_LETTERS).decode()
+
+
+def solve_bfs(maze: Maze, entry: tuple[int, int], exit: tuple[int, int],
+              stats: Optional[dict[str, int]] = None) -> str:
+    """
+    Find a shortest path with an iterative breadth-first search.
+
+    The search works on the flat grid of the maze with an explicit queue of
+    cell indexes and a one byte per cell parent buffer, so it is neither
+    limited by the recursion depth nor by the size of the maze.
+
+    Args:
+        maze (Maze): The maze to solve.
+        entry (tuple): Starting coordinates (x, y).
+        exit (tuple): Exit coordinates (x, y).
+        stats (Optional[dict]): If given, receives the number of expanded
+            cells as "nodes_expanded".
+
+    Returns:
+        str: The N/E/S/W directions from entry to exit, or "" if the exit
+             can't be reached.
+    """
+    width = maze.width
+    grid = maze.grid
+    last_row = len(grid) - width
+    start = entry[1] * width + entry[0]
+    goal = exit[1] * width + exit[0]
+
+    came_from = bytearray(len(grid))
+    came_from[start] = 1
+    queue = deque([start])
+
+    while queue:
+        i = queue.popleft()
+        if i == goal:
+            break
+        x = i % width
+
+        if i >= width:
+            n = i - width
+            if not came_from[n] and WALKABLE[grid[n]]:
+                came_from[n] = 1
+                queue.append(n)
+        if x != width - 1:
+            n = i + 1
+            if not came_from[n] and WALKABLE[grid[n]]:
+                came_from[n] = 2
+                queue.append(n)
+        if i < last_row:
+            n = i + width
+            if not came_from[n] and WALKABLE[grid[n]]:
+                came_from[n] = 3
+                queue.append(n)
+        if x != 0:
+            n = i - 1
+            if not came_from[n] and WALKABLE[grid[n]]:
+                came_from[n] = 4
+                queue.append(n)
+
+    if stats is not None:
+        # Every reached cell that is no longer queued has been expanded
+        reached = len(came_from) - came_from.count(0)
+        stats["nodes_expanded"] = reached - len(queue)
+    return trace_path(came_from, start, goal, width) if came_from[goal] else ""
+
+
+def solve_astar(maze: Maze, entry: tuple[int, int], exit: tuple[int, int],
+                stats: Optional[dict[str, int]] = None) -> str:
+    """
+    Find a shortest path with an A* search guided by the Manhattan distance
+    to the exit.
+
+    Like solve_bfs(), it uses the flat grid of the maze, a parent buffer
+    and an explicit priority queue, but it explores the cells closest to
+    the exit first.
+
+    Args:
+        maze (Maze): The maze to solve.
+        entry (tuple): Starting coordinates (x, y).
+        exit (tuple): Exit coordinates (x, y).
+        stats (Optional[dict]): If given, receives the number of expanded
+            cells as "nodes_expanded".
+
+    Returns:
+        str: The N/E/S/W directions from entry to exit, or "" if the exit
+             can't be reached.
+    """
+    width = maze.width
+    grid = maze.grid
+    last_row = len(grid) - width
+    start = entry[1] * width + entry[0]
+    goal = exit[1] * width + exit[0]
+    ex, ey = exit
+
+    came_from = bytearray(len(grid))
+    came_from[start] = 1
+    cost = array("l", [-1]) * len(grid)
+    cost[start] = 0
+    heap = [(abs(entry[0] - ex) + abs(entry[1] - ey), 0, start)]
+    expanded = 0
+
+    while heap:
+        _, g, i = heapq.heappop(heap)
+        if i == goal:
+            break
+        if g > cost[i]:
+            continue
+        expanded += 1
+        y, x = divmod(i, width)
+        g += 1
+
+        for n, direction, possible in ((i - width, 1, i >= width),
+                                       (i + 1, 2, x != width - 1),
+                                       (i + width, 3, i < last_row),
+                                       (i - 1, 4, x != 0)):
+            if not possible or not WALKABLE[grid[n]]:
+                continue
+            if cost[n] == -1 or g < cost[n]:
+                cost[n] = g
+                came_from[n] = direction
+                ny, nx = divmod(n, width)
+                heapq.heappush(heap, (g + abs(nx - ex) + abs(ny - ey),
+                                      g, n))
+
+    if stats is not None:
+        stats["nodes_expanded"] = expanded
+    return trace_path(came_from, start, goal, width) if came_from[goal] else ""
+
+
+def solve_bibfs(maze: Maze, entry: tuple[int, int], exit: tuple[int, int],
+                stats: Optional[dict[str, int]] = None) -> str:
+    """
+    Find a shortest path with a bidirectional breadth-first search.
+
+    Two searches grow from the entry and from the exit, one level at a
+    time, the smaller frontier first, until a cell reached by one of them
+    is reached by the other. Each side only explores about half the
+    distance, which saves most of the cells on open, imperfect mazes. Like
+    solve_bfs(), it uses the flat grid and one byte per cell and side: the
+    entry side stores the move that reached a cell, the exit side the move
+    leading back towards the exit, and the path is stitched at the meeting
+    cell.
+
+    Args:
+        maze (Maze): The maze to solve.
+        entry (tuple): Starting coordinates (x, y).
+        exit (tuple): Exit coordinates (x, y).
+        stats (Optional[dict]): If given, receives the number of expanded
+            cells of both sides as "nodes_expanded".
+
+    Returns:
+        str: The N/E/S/W directions from entry to exit, or "" if the exit
+             can't be reached.
+    """
+    width = maze.width
+    grid = maze.grid
+    last_row = len(grid) - width
+    start = entry[1] * width + entry[0]
+    goal = exit[1] * width + exit[0]
+
+    reached = (bytearray(len(grid)), bytearray(len(grid)))
+    reached[0][start] = 1
+    reached[1][goal] = 1
+    frontiers = [[start], [goal]]
+    meet = -1
+    expanded = 0
+
+    while frontiers[0] and frontiers[1] and meet < 0:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        own = reached[side]
+        other = reached[1 - side]
+        north, east, south, west = SIDE_CODES[side]
+        level = []
+        # A cell reached by the other side is open, even the entry
+        for i in frontiers[side]:
+            expanded += 1
+            x = i % width
+
+            if i >= width:
+                n = i - width
+                if not own[n]:
+                    if other[n]:
+                        own[n] = north
+                        meet = n
+                        break
+                    if WALKABLE[grid[n]]:
+                        own[n] = north
+                        level.append(n)
+            if x != width - 1:
+                n = i + 1
+                if not own[n]:
+                    if other[n]:
+                        own[n] = east
+                        meet = n
+                        break
+                    if WALKABLE[grid[n]]:
+                        own[n] = east
+                        level.append(n)
+            if i < last_row:
+                n = i + width
+                if not own[n]:
+                    if other[n]:
+                        own[n] = south
+                        meet = n
+                        break
+                    if WALKABLE[grid[n]]:
+                        own[n] = south
+                        level.append(n)
+            if x != 0:
+                n = i - 1
+                if not own[n]:
+                    if other[n]:
+                        own[n] = west
+                        meet = n
+                        break
+                    if WALKABLE[grid[n]]:
+                        own[n] = west
+                        level.append(n)
+        frontiers[side] = level
+
+    if stats is not None:
+        stats["nodes_expanded"] = expanded
+    if meet < 0:
+        return ""
+
+    ahead = (0, -width, 1, width, -1)
+    steps = bytearray()
+    i = meet
+    while i != goal:
+        direction = reached[1][i]
+        steps.append(direction)
+        i += ahead[direction]
+    return (trace_path(reached[0], start, meet, width)
+            + steps.translate(DIRECTION_LETTERS).decode())
+
+
+def get_path_cells(width: int, entry: tuple[int, int],
+                   path: str) -> list[int]:
+    """
+    Lists the grid indexes of the cells a path goes through, between the
+    entry and the exit (both excluded).
+
+    Args:
+        width (int): Width of the grid.
+        entry (tuple): Starting coordinates (x, y) of the path.
+        path (str): The N/E/S/W directions to follow.
+
+    Returns:
+        list[int]: The index of every cell of the path.
+    """
+    moves = {"N": -width, "E": 1, "S": width, "W": -1}
+    i = entry[1] * width + entry[0]
+    cells = []
+    for step in path[:-1]:
+        i += moves[step]
+        cells.append(i)
+    return cells
+
+
+def show_path(maze: Maze, cells: list[int],
+              observer: Optional[MazeObserver]) -> None:
+    """
+    Mark every cell of a path as SOLVE, notifying the observer of each one.
+
+    Args:
+        maze (Maze): The solved maze.
+        cells (list[int]): Grid indexes of the cells of the path.
+        observer (Optional[MazeObserver]): Follows the marking.
+    """
+    if observer:
+        observer.start(maze)
+    try:
+        for i in cells:
+            y, x = divmod(i, maze.width)
+            maze.change_cell((x, y), Cell.SOLVE)
+            if observer:
+                observer.cell_changed(maze, (x, y))
+    finally:
+        if observer:
+            observer.stop(maze)
+
+
+Solver = Callable[[Maze, tuple[int, int], tuple[int, int],
+                   Optional[dict[str, int]]], str]
+
+SOLVERS: dict[str, Solver] = {
+    "BFS": solve_bfs,
+    "ASTAR": solve_astar,
+    "BIBFS": solve_bibfs,
+}
@@ -0,0 +1,276 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  tiled.py                                          :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 22:06:51 by alebaron        #+#    #+#               #
+#  Updated: 2026/10/18 22:06:51 by alebaron        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from .Maze import Maze, CellCode
+from .kruskal import open_cells, get_edges, get_banned_walls
+from typing import Iterator
+import random
+
+
+# +-------------------------------------------------------------------------+
+# |                                Variable                                 |
+# +-------------------------------------------------------------------------+
+
+# Default width and height of a tile, in cells
+TILE_SIZE = 256
+
+# A tile to carve: its columns and rows, its banned walls (numbered inside
+# the tile) and its seed
+TileTask = tuple[int, int, frozenset[int], int]
+
+# A carved tile: its open east and south walls (one 0/1 byte per cell) and
+# the component of each cell of its border
+TileResult = tuple[bytes, bytes, dict[int, int]]
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+def carve_tiled(maze: Maze, rng: random.Random, tile_size: int = TILE_SIZE,
+                workers: int | None = None) -> int:
+    """
+    Generates a perfect maze by tiles, in a pool of processes.
+
+    The cells of the output file are split into tiles of tile_size x
+    tile_size cells. Each tile is carved on its own with Kruskal's
+    algorithm (see carve_tile()), from a seed drawn from `rng`, so the
+    maze only depends on the SEED and the tile size, not on the number of
+    processes. The tiles are then joined with one passage between every
+    two parts of a spanning tree over them (see join_tiles()), which keeps
+    the maze perfect. The logo splits a tile in several parts: they are
+    joined the same way. Like with carve_kruskal(), ENTRY and EXIT must
+    have odd coordinates.
+
+    Args:
+        maze (Maze): The maze to carve, full of walls.
+        rng (random.Random): The seeded generator to draw from.
+        tile_size (int): Width and height of a tile, in cells.
+        workers (int | None): Number of processes, CPU count by default.
+            With a single tile or a single process, the tiles are carved
+            in this process.
+
+    Returns:
+        int: The number of tiles.
+    """
+
+    width = maze.width
+    grid = maze.grid
+    cols = (width - 1) // 2
+    rows = (maze.height - 1) // 2
+    tile_cols = range(0, cols, tile_size)
+    tile_rows = range(0, rows, tile_size)
+
+    open_cells(maze)
+    banned = get_banned_walls(maze)
+
+    # The banned walls of each tile, numbered inside it
+    tile_banned: dict[int, set[int]] = {}
+    for edge in banned:
+        r, c = divmod(edge >> 1, cols)
+        if edge < 0:
+            continue
+        tile = r // tile_size * len(tile_cols) + c // tile_size
+        tile_width = min(tile_size, cols - c // tile_size * tile_size)
+        local = (r % tile_size) * tile_width + c % tile_size
+        tile_banned.setdefault(tile, set()).add(2 * local + (edge & 1))
+
+    tasks: list[TileTask] = []
+    for first_row in tile_rows:
+        for first_col in tile_cols:
+            tasks.append((min(tile_size, cols - first_col),
+                          min(tile_size, rows - first_row),
+                          frozenset(tile_banned.get(len(tasks), ())),
+                          rng.getrandbits(64)))
+
+    borders: list[dict[int, int]] = []
+    for tile, (east, south, border) in enumerate(
+            run_tiles(tasks, workers)):
+        first_row = tile_rows[tile // len(tile_cols)]
+        first_col = tile_cols[tile % len(tile_cols)]
+        tile_width, tile_height = tasks[tile][:2]
+        for r in range(tile_height):
+            y = 2 * (first_row + r) + 1
+            start = y * width + 2 * first_col + 2
+            flags = slice(r * tile_width, (r + 1) * tile_width)
+            # An opened wall is never strict: 3 - 1 is BLANK, without any
+            # borrow between the cells
+            for walls, opened in ((slice(start, start + 2 * tile_width, 2),
+                                   east[flags]),
+                                  (slice(start + width - 1,
+                                         start + width - 1 + 2 * tile_width,
+                                         2), south[flags])):
+                value = (int.from_bytes(grid[walls], "big")
+                         - int.from_bytes(opened, "big"))
+                grid[walls] = value.to_bytes(tile_width, "big")
+        borders.append(border)
+
+    join_tiles(maze, rng, tile_size, borders, banned)
+    maze.touch_all()
+    return len(tasks)
+
+
+def run_tiles(tasks: list[TileTask],
+              workers: int | None) -> Iterator[TileResult]:
+    """
+    Carves the tiles in a pool of processes, and yields them in order as
+    they are done.
+
+    Args:
+        tasks (list): The tiles to carve.
+        workers (int | None): Number of processes, CPU count by default.
+
+    Returns:
+        Iterator: The carved tiles, in the order of the tasks.
+    """
+    if workers == 1 or len(tasks) == 1:
+        yield from map(carve_tile, tasks)
+        return
+    # Only loaded by the runs which start a pool
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(carve_tile, tasks)
+
+
+def carve_tile(task: TileTask) -> TileResult:
+    """
+    Carves a tile with Kruskal's algorithm (see carve_kruskal()), on its
+    own. This is the task run by the worker processes.
+
+    Args:
+        task (TileTask): The columns, rows, banned walls and seed of the
+            tile.
+
+    Returns:
+        TileResult: The open east and south walls of each cell, and the
+        component (the root of its set) of each cell of the border.
+    """
+    cols, rows, banned, seed = task
+    edges = get_edges(cols, rows)
+    if banned:
+        edges = [edge for edge in edges if edge not in banned]
+    random.Random(seed).shuffle(edges)
+
+    east = bytearray(cols * rows)
+    south = bytearray(cols * rows)
+    parent = list(range(cols * rows))
+    for edge in edges:
+        a = edge >> 1
+        b = a + cols if edge & 1 else a + 1
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a == b:
+            continue
+        parent[b] = a
+        if edge & 1:
+            south[edge >> 1] = 1
+        else:
+            east[edge >> 1] = 1
+
+    def find(cell: int) -> int:
+        while parent[cell] != cell:
+            cell = parent[cell]
+        return cell
+
+    last = cols * rows - 1
+    border = {cell: find(cell) for cell in (
+        *range(cols), *range(last - cols + 1, last + 1),
+        *range(0, last + 1, cols), *range(cols - 1, last + 1, cols))}
+    return bytes(east), bytes(south), border
+
+
+def join_tiles(maze: Maze, rng: random.Random, tile_size: int,
+               borders: list[dict[int, int]], banned: set[int]) -> int:
+    """
+    Joins the carved tiles into a single perfect maze.
+
+    Each part of a tile (a set of its cells already connected) is a node,
+    and the walls between two neighbouring tiles are grouped by the pair of
+    parts they join. One wall is drawn per pair, then the pairs are visited
+    in a random order and the wall is opened when it joins two parts that
+    are not connected yet, which builds a spanning tree over the parts.
+
+    Args:
+        maze (Maze): The maze, with carved tiles.
+        rng (random.Random): The seeded generator to draw from.
+        tile_size (int): Width and height of a tile, in cells.
+        borders (list): For each tile, the part of each cell of its border.
+        banned (set[int]): The walls that must never be opened (see
+            get_banned_walls()).
+
+    Returns:
+        int: The number of opened walls.
+    """
+
+    width = maze.width
+    cols = (width - 1) // 2
+    rows = (maze.height - 1) // 2
+    count = len(range(0, cols, tile_size))
+
+    def get_part(cell: int) -> int:
+        # A part is named by its tile and the root of its set in the tile
+        r, c = divmod(cell, cols)
+        tile = r // tile_size * count + c // tile_size
+        tile_width = min(tile_size, cols - c // tile_size * tile_size)
+        local = (r % tile_size) * tile_width + c % tile_size
+        return tile * tile_size * tile_size + borders[tile][local]
+
+    # Walls across the tile boundaries, by pair of parts
+    pairs: dict[tuple[int, int], list[int]] = {}
+    for r in range(rows):
+        for c in range(tile_size - 1, cols - 1, tile_size):
+            cell = r * cols + c
+            if 2 * cell not in banned:
+                pairs.setdefault((get_part(cell), get_part(cell + 1)),
+                                 []).append(2 * cell)
+    for r in range(tile_size - 1, rows - 1, tile_size):
+        for c in range(cols):
+            cell = r * cols + c
+            if 2 * cell + 1 not in banned:
+                pairs.setdefault((get_part(cell), get_part(cell + cols)),
+                                 []).append(2 * cell + 1)
+
+    walls = [edges[rng.randrange(len(edges))] for edges in pairs.values()]
+    parts = list(pairs)
+    order = list(range(len(parts)))
+    rng.shuffle(order)
+
+    parent: dict[int, int] = {}
+
+    def find(part: int) -> int:
+        while parent.get(part, part) != part:
+            part = parent[part]
+        return part
+
+    opened = 0
+    for i in order:
+        a, b = (find(part) for part in parts[i])
+        if a == b:
+            continue
+        parent[b] = a
+        r, c = divmod(walls[i] >> 1, cols)
+        if walls[i] & 1:
+            maze.grid[(2 * r + 2) * width + 2 * c + 1] = CellCode.BLANK
+        else:
+            maze.grid[(2 * r + 1) * width + 2 * c + 2] = CellCode.BLANK
+        opened += 1
+    return opened
@@ -19,21 +19,31 @@ from src.maze.Maze import Color, Maze
 from src.utils.effect import Effect
 from src.utils.theme import Theme
 from typing import Dict, Callable, cast, Any
-from random import choice, seed
+from random import Random
 from src.maze.Maze_Generator import Maze_Generator
 from src.maze.resolution import resolution
+from src.menu.terminal_observer import TerminalObserver
 import os
 
 
+# +-------------------------------------------------------------------------+
+# |                                Variable                                 |
+# +-------------------------------------------------------------------------+
+
+# The colors have their own random generator, seeded by the system, so that
+# picking them never touches the generator of the maze.
+COLOR_RANDOM = Random()
+
+
 # +-------------------------------------------------------------------------+
 # |                            Input Functions                              |
 # +-------------------------------------------------------------------------+
 
 def regen_maze(maze: Maze, config: dict[str, Any]) -> Maze:
     """
-    Regenerate a new maze using the Hunt-and-Kill algorithm and solve it.
+    Regenerate a new maze using the algorithm of the config and solve it.
     This function first cleans the current maze, then generates a new maze
-    using the Hunt-and-Kill algorithm.
+    with the generator selected by the GENERATOR key of the config.
     After the new maze is generated, itcalls the resolution function to find
     the path from the entry to the exit.
     Finally, it prints the newly generated maze.
@@ -45,13 +55,14 @@ def regen_maze(maze: Maze, config: dict[str, Any]) -> Maze:
     """
 
     maze.clean_maze()
-    maze_gen = Maze_Generator()
-    maze_gen.hunt_and_kill(maze, config)
+    maze_gen = Maze_Generator(TerminalObserver(0.02))
+    maze_gen.generate(maze, config)
     if not config["HIDE"]:
         os.system("clear")
-    path = resolution(maze, config)
+    resolution(maze, config, TerminalObserver(0.05))
     if not config["HIDE"]:
-        print(f"The exit is {len(path)} steps away from the entry!")
+        print(f"The exit is {maze.get_distance(maze.entry)} steps away "
+              "from the entry!")
     return maze
 
 
@@ -73,8 +84,9 @@ def show_hide_path(maze: Maze, config: dict[str, Any]) -> None:
         print(maze.show_maze())
 
     def show() -> None:
-        path = resolution(maze, config)
-        print(f"The exit is {len(path)} steps away from the entry!")
+        resolution(maze, config, TerminalObserver(0.05))
+        print(f"The exit is {maze.get_distance(maze.entry)} steps away "
+              "from the entry!")
 
     if config["HIDE"]:
         config["HIDE"] = not config["HIDE"]
@@ -366,7 +378,7 @@ def get_random_color(color: Dict[str, Color | str]) -> None:
         color settings, which will be updated with new random colors.
     """
 
-    seed()
+    choice = COLOR_RANDOM.choice
     color_list = list(Color)
     color["STRICT"] = choice(color_list).value
     color["WALL"] = choice(color_list).value
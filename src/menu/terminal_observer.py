@@ -0,0 +1,63 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  terminal_observer.py                              :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 11:02:18 by tcolson         #+#    #+#               #
+#  Updated: 2026/10/18 11:02:18 by tcolson         ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from src.maze.Maze import Maze
+from src.maze.observer import MazeObserver
+import sys
+import time
+
+
+# +-------------------------------------------------------------------------+
+# |                                 Class                                   |
+# +-------------------------------------------------------------------------+
+
+class TerminalObserver(MazeObserver):
+    """
+    Animates a generation or a resolution in the terminal.
+
+    The whole maze is drawn once at the top of the screen, then every
+    update only moves the cursor onto the changed cells and redraws them,
+    so the output stays proportional to what changed. The maze only
+    records its changes while the observer is attached (see Maze.tracked).
+
+    Attributes:
+        delay (float): Pause, in seconds, after every animated cell change.
+    """
+
+    def __init__(self, delay: float = 0.02) -> None:
+        self.delay: float = delay
+
+    def start(self, maze: Maze) -> None:
+        maze.tracked = True
+        maze.redraw = True
+        sys.stdout.write("\033[H\033[2J" + maze.render_changes())
+        sys.stdout.flush()
+
+    def cell_changed(self, maze: Maze, cell: tuple[int, int]) -> None:
+        self.refresh(maze)
+        time.sleep(self.delay)
+
+    def refresh(self, maze: Maze) -> None:
+        sys.stdout.write(maze.render_changes())
+        sys.stdout.flush()
+
+    def stop(self, maze: Maze) -> None:
+        # Leave the cursor under the maze
+        sys.stdout.write(maze.render_changes() + f"\033[{maze.height + 3};1H")
+        sys.stdout.flush()
+        maze.tracked = False
+        maze.dirty.clear()
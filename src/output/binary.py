@@ -0,0 +1,227 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  binary.py                                         :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 20:03:44 by tcolson         #+#    #+#               #
+#  Updated: 2026/10/18 20:03:44 by tcolson         ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from src.utils.error import OutputFileError
+from typing import BinaryIO, Iterable, Iterator, Tuple
+import struct
+
+
+# +-------------------------------------------------------------------------+
+# |                                Variable                                 |
+# +-------------------------------------------------------------------------+
+
+# Output files with this extension are written in the binary format:
+#
+#   header  magic "AMZB", version (u8), columns, rows, entry x, entry y,
+#           exit x, exit y (u32 each) and path steps (u64), little-endian
+#   walls   the wall nibble of every cell, row after row, two cells per
+#           byte (the first one in the high nibble)
+#   path    two bits per step (N = 0, E = 1, S = 2, W = 3), four steps per
+#           byte (the first one in the high bits)
+BINARY_EXT = ".mzb"
+MAGIC = b"AMZB"
+VERSION = 1
+HEADER = struct.Struct("<4sBIIIIIIQ")
+
+# bytes.translate() tables between the two nibbles of a byte and their
+# values, and between the path letters and their 2-bit codes
+HIGH_TABLE = bytes(byte >> 4 for byte in range(256))
+LOW_TABLE = bytes(byte & 15 for byte in range(256))
+STEP_CODES = bytes(b"NESW".find(byte) % 256 for byte in range(256))
+STEP_TABLES = [bytes(b"NESW"[byte >> shift & 3] for byte in range(256))
+               for shift in (6, 4, 2, 0)]
+
+# Bytes of walls read at once
+WALL_CHUNK = 1 << 16
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+def write_binary(filename: str, entry: Tuple[int, int],
+                 exit: Tuple[int, int], wall_rows: Iterable[bytes],
+                 path_chunks: Iterable[bytes]) -> int:
+    """
+    Writes a maze in the binary format, from its rows of wall nibbles and
+    its path. Both are written as they arrive, so a maze produced one row
+    at a time never has to be kept in memory: the sizes are counted on the
+    way and the header is written again at the end.
+
+    Args:
+        filename (str): The output file.
+        entry (Tuple[int, int]): The coordinates of the entry.
+        exit (Tuple[int, int]): The coordinates of the exit.
+        wall_rows (Iterable[bytes]): The wall nibble of each cell, one row
+            at a time.
+        path_chunks (Iterable[bytes]): The N/E/S/W path, in pieces whose
+            lengths are multiples of 4 (but the last one).
+
+    Returns:
+        int: The size of the file.
+    """
+    cols = rows = steps = 0
+
+    def count_rows() -> Iterator[bytes]:
+        nonlocal cols, rows
+        for row in wall_rows:
+            cols = len(row)
+            rows += 1
+            yield row
+
+    with open(filename, "wb") as file:
+        file.write(bytes(HEADER.size))
+        for packed in pack_nibbles(count_rows()):
+            file.write(packed)
+        for chunk in path_chunks:
+            steps += len(chunk)
+            file.write(pack_path(chunk))
+        size = file.tell()
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, cols, rows, *entry, *exit,
+                               steps))
+    return size
+
+
+def read_header(file: BinaryIO) -> tuple[int, ...]:
+    """
+    Reads and checks the header of a binary maze file.
+
+    Args:
+        file (BinaryIO): The file, at its beginning.
+
+    Returns:
+        tuple: The columns, rows, entry x and y, exit x and y, and the
+        number of steps of the path.
+    """
+    data = file.read(HEADER.size)
+    if len(data) != HEADER.size or not data.startswith(MAGIC):
+        raise OutputFileError(f"{file.name} is not a binary maze file.")
+    _, version, *fields = HEADER.unpack(data)
+    if version != VERSION:
+        raise OutputFileError(f"{file.name}: unknown version {version}.")
+    return tuple(fields)
+
+
+def get_binary_rows(file: BinaryIO, cols: int,
+                    rows: int) -> Iterator[bytes]:
+    """
+    Yields the rows of wall nibbles of a binary maze file, reading the
+    walls by chunks.
+
+    Args:
+        file (BinaryIO): The file, right after its header.
+        cols (int): Number of cells in a row.
+        rows (int): Number of rows of cells.
+
+    Returns:
+        Iterator[bytes]: The wall nibble of each cell, one row at a time.
+    """
+    left = (cols * rows + 1) // 2
+    pending = bytearray()
+    for _ in range(rows):
+        while len(pending) < cols:
+            packed = file.read(min(WALL_CHUNK, left))
+            if not packed:
+                raise OutputFileError(f"{file.name} is truncated.")
+            left -= len(packed)
+            pending += unpack_nibbles(packed)
+        yield bytes(pending[:cols])
+        del pending[:cols]
+
+
+def get_binary_path(file: BinaryIO, steps: int) -> Iterator[bytes]:
+    """
+    Yields the path of a binary maze file, as N/E/S/W letters.
+
+    Args:
+        file (BinaryIO): The file, right after its walls.
+        steps (int): Number of steps of the path.
+
+    Returns:
+        Iterator[bytes]: The letters of the path, by chunks.
+    """
+    while steps > 0:
+        packed = file.read(min(WALL_CHUNK, (steps + 3) // 4))
+        if not packed:
+            raise OutputFileError(f"{file.name} is truncated.")
+        letters = bytes(unpack_path(packed)[:steps])
+        steps -= len(letters)
+        yield letters
+
+
+def pack_nibbles(rows: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Packs rows of nibbles two per byte. A row of odd length shares its last
+    byte with the next one, only the very last byte can be half empty.
+
+    Args:
+        rows (Iterable[bytes]): Rows of values below 16.
+
+    Returns:
+        Iterator[bytes]: The packed bytes, one piece per row.
+    """
+    carry = b""
+    for row in rows:
+        data = carry + row
+        even = len(data) & ~1
+        carry = data[even:]
+        if even:
+            yield pack_pairs(data[:even])
+    if carry:
+        yield pack_pairs(carry + b"\x00")
+
+
+def pack_pairs(data: bytes) -> bytes:
+    # Read as big integers, the high and low nibbles can be merged with a
+    # single shift, without any carry between bytes
+    value = (int.from_bytes(data[0::2], "big") << 4
+             | int.from_bytes(data[1::2], "big"))
+    return value.to_bytes(len(data) // 2, "big")
+
+
+def unpack_nibbles(packed: bytes) -> bytearray:
+    data = bytearray(2 * len(packed))
+    data[0::2] = packed.translate(HIGH_TABLE)
+    data[1::2] = packed.translate(LOW_TABLE)
+    return data
+
+
+def pack_path(path: bytes) -> bytes:
+    """
+    Packs N/E/S/W letters four per byte, the last byte being padded with N.
+
+    Args:
+        path (bytes): The letters of the path.
+
+    Returns:
+        bytes: The packed path.
+    """
+    codes = path.translate(STEP_CODES) + bytes(-len(path) % 4)
+    if 255 in codes:
+        raise OutputFileError("The path must only contain N, E, S and W.")
+    value = 0
+    for shift, start in ((6, 0), (4, 1), (2, 2), (0, 3)):
+        value |= int.from_bytes(codes[start::4], "big") << shift
+    return value.to_bytes(len(codes) // 4, "big")
+
+
+def unpack_path(packed: bytes) -> bytearray:
+    letters = bytearray(4 * len(packed))
+    for start, table in enumerate(STEP_TABLES):
+        letters[start::4] = packed.translate(table)
+    return letters
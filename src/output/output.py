@@ -15,20 +15,45 @@
 # +-------------------------------------------------------------------------+
 
 
-from src.maze.Maze import Maze, Cell
-from typing import Tuple
+from src.maze.Maze import Maze, CellCode
+from src.utils.profiler import Profiler
+from src.output.binary import BINARY_EXT, write_binary
+from typing import BinaryIO, Tuple, Iterator, Iterable, Optional, cast
+import os
+
+
+# +-------------------------------------------------------------------------+
+# |                                Variable                                 |
+# +-------------------------------------------------------------------------+
+
+# bytes.translate() tables: cell code -> 1 if it is a wall, nibble -> digit
+WALL_TABLE = bytes(code in (CellCode.WALL, CellCode.STRICT)
+                   for code in range(256))
+HEX_TABLE = b"0123456789ABCDEF".ljust(256, b"?")
+
+# A row of 0/1 wall flags, one byte per cell
+Flags = bytes | bytearray
+
+# Text outputs with these extensions (e.g. maze.txt.gz) are compressed
+COMPRESSED_EXTS = (".gz", ".xz")
+DEFAULT_LEVEL = 6
 
 
 # +-------------------------------------------------------------------------+
 # |                                Function                                 |
 # +-------------------------------------------------------------------------+
 
-def put_maze_val(maze: Maze, filename: str, path: str) -> None:
+def put_maze_val(maze: Maze, filename: str, path: str,
+                 profiler: Optional[Profiler] = None,
+                 level: int = DEFAULT_LEVEL) -> None:
     """
     Writes the maze's structure and solution path to a file in a specific
     format. The maze is represented as a grid of hexadecimal values, where
     each value encodes the presence of walls around a cell. The function also
     includes the entry and exit coordinates, as well as the solution path.
+    A filename ending with ".mzb" gets the same content in the binary
+    format instead (see src/output/binary.py), and one ending with ".gz"
+    or ".xz" is compressed row by row (see open_output()).
 
     Args:
         maze (Maze): The maze object containing the grid and cell manipulation
@@ -38,19 +63,212 @@ def put_maze_val(maze: Maze, filename: str, path: str) -> None:
         path (str): A string representing the solution path through the maze,
                     typically consisting of characters like 'N', 'S', 'E', 'W'
                     for directions.
+        profiler (Optional[Profiler]): Counts the written rows and bytes
+            (before compression).
+        level (int): The compression level, from 0 to 9.
+    """
+
+    if filename.endswith(BINARY_EXT):
+        size = write_binary(filename, maze.entry, maze.exit,
+                            get_wall_rows(maze), [path.encode()])
+        if profiler is not None:
+            profiler.count("output_rows", (maze.height - 1) // 2)
+            profiler.count("output_bytes", size)
+        return
+
+    xentry, yentry = maze.entry
+    xexit, yexit = maze.exit
+    rows = size = 0
+    with open_output(filename, level) as file:
+        for row in get_hex_rows(maze):
+            size += file.write(row + b"\n")
+            rows += 1
+        size += file.write(f"\n{xentry},{yentry}\n{xexit},{yexit}\n"
+                           f"{path}\n".encode())
+
+    if profiler is not None:
+        profiler.count("output_rows", rows)
+        profiler.count("output_bytes", size)
+
+
+def open_output(filename: str, level: int = DEFAULT_LEVEL,
+                mode: str = "wb") -> BinaryIO:
+    """
+    Opens an output file, through a gzip or xz compressor (or decompressor)
+    when its name ends with ".gz" or ".xz". The text goes through it in
+    pieces, so the compressed file is never held in memory.
+
+    Args:
+        filename (str): The name of the file.
+        level (int): The compression level, from 0 to 9 (ignored when
+            reading).
+        mode (str): "wb" to write, "rb" to read.
+
+    Returns:
+        BinaryIO: The opened file.
     """
 
-    with open(filename, "w") as file:
-        for y in range(1, maze.height - 1, 2):
-            for x in range(1, maze.width - 1, 2):
-                file.write(get_hex_val(maze, (x, y)))
-            file.write("\n")
-        file.write("\n")
-        xentry, yentry = maze.entry
-        file.write(f"{xentry},{yentry}\n")
-        xexit, yexit = maze.exit
-        file.write(f"{xexit},{yexit}\n")
-        file.write(f"{path}\n")
+    # The compressors are only loaded for the files that need them
+    if filename.endswith(".gz"):
+        import gzip
+
+        if mode == "rb":
+            return cast(BinaryIO, gzip.open(filename, mode))
+        return cast(BinaryIO, gzip.open(filename, mode, compresslevel=level))
+    if filename.endswith(".xz"):
+        import lzma
+
+        if mode == "rb":
+            return cast(BinaryIO, lzma.open(filename, mode))
+        return cast(BinaryIO, lzma.open(filename, mode, preset=level))
+    return cast(BinaryIO, open(filename, mode))
+
+
+def split_output_name(filename: str) -> Tuple[str, str]:
+    """
+    Splits an output filename into its stem and its extension, the
+    compression extension included (e.g. "maze", ".txt.gz").
+
+    Args:
+        filename (str): The name of the file.
+
+    Returns:
+        Tuple[str, str]: The stem and the extension.
+    """
+
+    stem, ext = os.path.splitext(filename)
+    if ext in COMPRESSED_EXTS:
+        stem, inner = os.path.splitext(stem)
+        ext = inner + ext
+    return stem, ext
+
+
+def get_hex_rows(maze: Maze) -> Iterator[bytes]:
+    """
+    Yields the hexadecimal encoding of the maze, one row at a time.
+
+    Args:
+        maze (Maze): The maze object containing the grid.
+
+    Returns:
+        Iterator[bytes]: One row of hexadecimal digits per logical row.
+    """
+
+    for row in get_wall_rows(maze):
+        yield row.translate(HEX_TABLE)
+
+
+def get_wall_rows(maze: Maze) -> Iterator[bytes]:
+    """
+    Yields the wall nibbles of the maze, one row at a time.
+
+    Instead of looking at every cell, a whole row is encoded at once: the
+    grid is turned into a buffer of 0/1 wall flags, and the flags of the
+    northern, eastern, southern and western neighbours of the row are
+    sliced out of it and encoded together by encode_walls().
+
+    Args:
+        maze (Maze): The maze object containing the grid.
+
+    Returns:
+        Iterator[bytes]: One byte (0 to 15) per cell, one row at a time.
+    """
+
+    width = maze.width
+    walls = maze.grid.translate(WALL_TABLE)
+    count = len(range(1, width - 1, 2))
+
+    for y in range(1, maze.height - 1, 2):
+        row = y * width
+        north = walls[row - width + 1:row - 1:2]
+        east = walls[row + 2:row + width:2][:count]
+        south = walls[row + width + 1:row + 2 * width - 1:2]
+        west = walls[row:row + width - 2:2][:count]
+
+        yield encode_walls(north, east, south, west)
+
+
+def encode_row(north: Flags, east: Flags, south: Flags,
+               west: Flags) -> bytes:
+    """
+    Encodes a row of cells into hexadecimal digits (see encode_walls()).
+
+    Args:
+        north (bytes): 1 for each cell with a northern wall, else 0.
+        east (bytes): The same for the eastern walls.
+        south (bytes): The same for the southern walls.
+        west (bytes): The same for the western walls.
+
+    Returns:
+        bytes: The hexadecimal digits of the row.
+    """
+
+    return encode_walls(north, east, south, west).translate(HEX_TABLE)
+
+
+def encode_walls(north: Flags, east: Flags, south: Flags,
+                 west: Flags) -> bytes:
+    """
+    Encodes a row of cells from the 0/1 wall flags of each side, one byte
+    per cell. Read as big integers, the flags can be combined with shifts
+    and additions without any carry between cells, since a cell never
+    exceeds 15.
+
+    Args:
+        north (bytes): 1 for each cell with a northern wall, else 0.
+        east (bytes): The same for the eastern walls.
+        south (bytes): The same for the southern walls.
+        west (bytes): The same for the western walls.
+
+    Returns:
+        bytes: The wall nibble (0 to 15) of each cell of the row.
+    """
+
+    val = (int.from_bytes(north, "big")
+           | int.from_bytes(east, "big") << 1
+           | int.from_bytes(south, "big") << 2
+           | int.from_bytes(west, "big") << 3)
+    return val.to_bytes(len(north), "big")
+
+
+def put_rows_val(rows: Iterable[tuple[Flags, Flags]], filename: str,
+                 entry: Tuple[int, int], exit: Tuple[int, int],
+                 path: str = "", level: int = DEFAULT_LEVEL) -> None:
+    """
+    Writes a maze produced one row at a time, in the same format as
+    put_maze_val(). Each row is encoded and written as soon as it arrives,
+    so only the previous row is kept in memory, whatever the height. Like
+    with put_maze_val(), the filename selects the binary format or the
+    compression.
+
+    Args:
+        rows (Iterable): For each row of cells, the 0/1 flags of their
+            eastern and southern walls.
+        filename (str): The name of the output file.
+        entry (Tuple[int, int]): The coordinates of the entry.
+        exit (Tuple[int, int]): The coordinates of the exit.
+        path (str): The solution path, if it is known.
+        level (int): The compression level, from 0 to 9.
+    """
+
+    def get_rows() -> Iterator[bytes]:
+        north: Flags = b""
+        for east, south in rows:
+            if not north:
+                north = b"\x01" * len(east)
+            west = b"\x01" + east[:-1]
+            yield encode_walls(north, east, south, west)
+            north = south
+
+    if filename.endswith(BINARY_EXT):
+        write_binary(filename, entry, exit, get_rows(), [path.encode()])
+        return
+
+    with open_output(filename, level) as file:
+        for row in get_rows():
+            file.write(row.translate(HEX_TABLE) + b"\n")
+        file.write(f"\n{entry[0]},{entry[1]}\n{exit[0]},{exit[1]}\n"
+                   f"{path}\n".encode())
 
 
 def get_hex_val(maze: Maze, cell: Tuple[int, int]) -> str:
@@ -84,13 +302,17 @@ def get_hex_val(maze: Maze, cell: Tuple[int, int]) -> str:
     """
 
     x, y = cell
+    width = maze.width
+    grid = maze.grid
+    walls = (CellCode.WALL, CellCode.STRICT)
+    i = y * width + x
     val = 0
-    if y == 0 or maze.maze[(x, y - 1)] in [Cell.WALL, Cell.STRICT]:
+    if y == 0 or grid[i - width] in walls:
         val += 1
-    if x == maze.width or maze.maze[(x + 1, y)] in [Cell.WALL, Cell.STRICT]:
+    if x == width or grid[i + 1] in walls:
         val += 2
-    if y == maze.height or maze.maze[(x, y + 1)] in [Cell.WALL, Cell.STRICT]:
+    if y == maze.height or grid[i + width] in walls:
         val += 4
-    if x == 0 or maze.maze[(x - 1, y)] in [Cell.WALL, Cell.STRICT]:
+    if x == 0 or grid[i - 1] in walls:
         val += 8
-    return hex(val).strip("0x").capitalize()
+    return format(val, "X")
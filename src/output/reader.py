@@ -0,0 +1,559 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  reader.py                                         :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 19:24:06 by tcolson         #+#    #+#               #
+#  Updated: 2026/10/18 19:24:06 by tcolson         ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from src.maze.resolution import trace_path
+from src.output.binary import BINARY_EXT, MAGIC, write_binary, read_header
+from src.output.binary import get_binary_rows, get_binary_path
+from src.output.output import HEX_TABLE, COMPRESSED_EXTS
+from src.output.output import open_output, split_output_name
+from src.utils.error import OutputFileError
+from collections import deque
+from types import TracebackType
+from typing import BinaryIO, Iterator, cast
+import json
+import lzma
+import mmap
+import os
+import shutil
+import tempfile
+
+
+# +-------------------------------------------------------------------------+
+# |                                Variable                                 |
+# +-------------------------------------------------------------------------+
+
+NORTH, EAST, SOUTH, WEST = 1, 2, 4, 8
+
+# bytes.translate() tables: hexadecimal digit -> wall nibble (INVALID for
+# any other byte), then wall nibble -> 0/1 flag of one of its sides
+INVALID = 255
+NIBBLE_TABLE = bytes(int(chr(byte), 16) if chr(byte) in "0123456789ABCDEF"
+                     else INVALID for byte in range(256))
+NORTH_TABLE = bytes(value & NORTH and 1 for value in range(256))
+EAST_TABLE = bytes(value & EAST and 1 for value in range(256))
+SOUTH_TABLE = bytes(value & SOUTH and 1 for value in range(256))
+WEST_TABLE = bytes(value & WEST and 1 for value in range(256))
+
+# Number of open sides of each wall nibble
+OPEN_SIDES = [4 - bin(value).count("1") for value in range(16)]
+
+# Size of the pieces of the path line read at once
+PATH_CHUNK = 1 << 20
+
+# Validation stops after this many errors
+MAX_ERRORS = 20
+
+
+# +-------------------------------------------------------------------------+
+# |                                 Class                                   |
+# +-------------------------------------------------------------------------+
+
+class MazeFile:
+    """
+    Read-only view of an output file, as written by put_maze_val().
+
+    The file is memory-mapped and never decoded as a whole: every row of
+    hexadecimal digits has the same length, so a cell is found from its
+    row offset, and its digit is turned into a wall nibble when it is read.
+    Only the pages actually read are loaded, and the system can drop them
+    again, so even files larger than the memory can be read. A compressed
+    file (.gz or .xz) is first decompressed, and a binary one (.mzb)
+    decoded, by chunks, into a temporary text file which is mapped instead.
+
+    The file describes cells, while the entry, the exit and the path are
+    given in coordinates of the grid, where cell (c, r) is (2c + 1, 2r + 1)
+    and the grid cells between them are their walls.
+
+    Attributes:
+        filename (str): The path of the file.
+        data (mmap.mmap): The mapped content of the file.
+        cols (int): Number of cells in a row.
+        rows (int): Number of rows of cells.
+        entry (tuple[int, int]): Grid coordinates of the entry.
+        exit (tuple[int, int]): Grid coordinates of the exit.
+
+    Methods:
+        get_walls(self, row: int) -> bytes:
+            Returns the wall nibbles of a row of cells.
+
+        get_cell_walls(self, col: int, row: int) -> int:
+            Returns the wall nibble of a cell.
+
+        get_cell_of(self, point: tuple[int, int]) -> tuple[int, int]:
+            Returns the cell holding a point of the grid.
+
+        get_path(self) -> Iterator[bytes]:
+            Yields the path line of the file, piece by piece.
+
+        solve(self) -> str:
+            Finds a shortest path from the entry to the exit.
+
+        validate(self) -> list[str]:
+            Checks the format and the consistency of the walls.
+
+        get_stats(self) -> dict[str, int]:
+            Counts the cells, passages and dead ends of the maze.
+
+        close(self) -> None:
+            Unmaps and closes the file.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        if filename.endswith(COMPRESSED_EXTS):
+            self.file = get_decompressed(filename)
+        else:
+            try:
+                self.file = open(filename, "rb")
+            except OSError as e:
+                raise OutputFileError(f"Can't open {filename} "
+                                      f"({e.strerror}).")
+            if self.file.read(len(MAGIC)) == MAGIC:
+                self.file = get_decoded(self.file)
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise OutputFileError(f"{filename} is empty.")
+
+        try:
+            self.read_header()
+        except OutputFileError:
+            self.close()
+            raise
+
+    def read_header(self) -> None:
+        data = self.data
+        self.cols = data.find(b"\n")
+        end = data.find(b"\n\n")
+        if self.cols <= 0 or end == -1:
+            raise OutputFileError(f"{self.filename} is not a maze output "
+                                  "file.")
+        self.stride = self.cols + 1
+        self.rows = (end + 1) // self.stride
+
+        entry_end = data.find(b"\n", end + 2)
+        exit_end = data.find(b"\n", entry_end + 1)
+        if entry_end == -1 or exit_end == -1:
+            raise OutputFileError(f"{self.filename} has no entry and exit.")
+        self.entry = get_coords(data[end + 2:entry_end])
+        self.exit = get_coords(data[entry_end + 1:exit_end])
+        self.path_start = exit_end + 1
+        path_end = data.find(b"\n", self.path_start)
+        self.path_end = len(data) if path_end == -1 else path_end
+
+    def __enter__(self) -> "MazeFile":
+        return self
+
+    def __exit__(self, kind: type[BaseException] | None,
+                 value: BaseException | None,
+                 traceback: TracebackType | None) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.data.close()
+        self.file.close()
+
+    def get_walls(self, row: int) -> bytes:
+        start = row * self.stride
+        return self.data[start:start + self.cols].translate(NIBBLE_TABLE)
+
+    def get_cell_walls(self, col: int, row: int) -> int:
+        return NIBBLE_TABLE[self.data[row * self.stride + col]]
+
+    def get_cell_of(self, point: tuple[int, int]) -> tuple[int, int]:
+        # Points on a wall belong to the cell after it, but the last walls
+        # to the last cells
+        x, y = point
+        return (min(x // 2, self.cols - 1), min(y // 2, self.rows - 1))
+
+    def get_path(self) -> Iterator[bytes]:
+        for start in range(self.path_start, self.path_end, PATH_CHUNK):
+            yield self.data[start:min(start + PATH_CHUNK, self.path_end)]
+
+    def solve(self) -> str:
+        """
+        Finds a shortest path from the entry to the exit, with a
+        breadth-first search reading the walls straight from the file.
+        Besides the queue, it only needs one byte per cell, to remember the
+        move that reached it.
+
+        Like in the output file, the path goes through the grid: each move
+        from a cell to the next one is written twice (e.g. "EE").
+
+        Returns:
+            str: The N/E/S/W directions from the entry to the exit, or ""
+            if the exit can't be reached.
+        """
+        data = self.data
+        cols = self.cols
+        rows = self.rows
+        stride = self.stride
+        nibbles = NIBBLE_TABLE
+        x, y = self.get_cell_of(self.entry)
+        start = y * cols + x
+        x, y = self.get_cell_of(self.exit)
+        goal = y * cols + x
+
+        came_from = bytearray(cols * rows)
+        came_from[start] = 1
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            if i == goal:
+                break
+            row, col = divmod(i, cols)
+            walls = nibbles[data[row * stride + col]]
+            if walls == INVALID:
+                continue
+
+            if not walls & NORTH and row > 0 and not came_from[i - cols]:
+                came_from[i - cols] = 1
+                queue.append(i - cols)
+            if not walls & EAST and col < cols - 1 and not came_from[i + 1]:
+                came_from[i + 1] = 2
+                queue.append(i + 1)
+            if not walls & SOUTH and row < rows - 1 and \
+               not came_from[i + cols]:
+                came_from[i + cols] = 3
+                queue.append(i + cols)
+            if not walls & WEST and col > 0 and not came_from[i - 1]:
+                came_from[i - 1] = 4
+                queue.append(i - 1)
+
+        if not came_from[goal]:
+            return ""
+        path = trace_path(came_from, start, goal, cols)
+        for step in "NESW":
+            path = path.replace(step, step * 2)
+        return path
+
+    def validate(self) -> list[str]:
+        """
+        Checks, one row at a time, that the file is a well formed maze:
+        rows of the same length made of hexadecimal digits, closed outer
+        walls, neighbouring cells that agree on the wall between them, an
+        entry and an exit inside the maze, and a path (if any) that goes
+        from the entry to the exit through open cells only.
+
+        Returns:
+            list[str]: The errors found, empty if the file is valid. The
+            check stops after MAX_ERRORS errors.
+        """
+        data = self.data
+        cols = self.cols
+        closed = b"\x01" * cols
+        errors: list[str] = []
+        north: bytes | None = None
+
+        for row in range(self.rows):
+            if len(errors) >= MAX_ERRORS:
+                return errors
+            if data[row * self.stride + cols] != ord("\n"):
+                errors.append(f"Row {row}: expected {cols} digits.")
+                return errors
+            walls = self.get_walls(row)
+            if INVALID in walls:
+                errors.append(f"Row {row}: invalid digit at column "
+                              f"{walls.index(INVALID)}.")
+                north = None
+                continue
+
+            east = walls.translate(EAST_TABLE)
+            west = walls.translate(WEST_TABLE)
+            own_north = walls.translate(NORTH_TABLE)
+            if row == 0 and own_north != closed:
+                errors.append("Row 0: the northern border is open.")
+            if north is not None and own_north != north:
+                col = get_first_difference(own_north, north)
+                errors.append(f"Rows {row - 1} and {row}: column {col} "
+                              "disagrees on the wall between them.")
+            if not east[-1] or not west[0]:
+                errors.append(f"Row {row}: the eastern or western border is "
+                              "open.")
+            if east[:-1] != west[1:]:
+                col = get_first_difference(east[:-1], west[1:])
+                errors.append(f"Row {row}: columns {col} and {col + 1} "
+                              "disagree on the wall between them.")
+            north = walls.translate(SOUTH_TABLE)
+
+        if north is not None and north != closed:
+            errors.append(f"Row {self.rows - 1}: the southern border is "
+                          "open.")
+
+        for name, (x, y) in (("Entry", self.entry), ("Exit", self.exit)):
+            if not (0 <= x <= 2 * cols and 0 <= y <= 2 * self.rows):
+                errors.append(f"{name} ({x},{y}) is outside the maze.")
+        if self.entry == self.exit:
+            errors.append("Entry and exit are at the same place.")
+
+        if not errors and self.path_end > self.path_start:
+            errors.extend(self.validate_path())
+        return errors[:MAX_ERRORS]
+
+    def validate_path(self) -> list[str]:
+        x, y = self.entry
+        if x % 2 == 0 or y % 2 == 0:
+            # The maze was carved on the even grid lines, which the file
+            # doesn't describe
+            return []
+
+        moves = {ord("N"): (0, -1), ord("E"): (1, 0),
+                 ord("S"): (0, 1), ord("W"): (-1, 0)}
+        steps = 0
+        for chunk in self.get_path():
+            for step in chunk:
+                if step not in moves:
+                    return [f"Path: invalid direction at step {steps}."]
+                dx, dy = moves[step]
+                x, y = x + dx, y + dy
+                steps += 1
+                if not self.is_open(x, y):
+                    return [f"Path: step {steps} goes through a wall at "
+                            f"({x},{y})."]
+        if (x, y) != self.exit:
+            return [f"Path: ends at ({x},{y}), not at the exit."]
+        return []
+
+    def is_open(self, x: int, y: int) -> bool:
+        if not (0 < x < 2 * self.cols and 0 < y < 2 * self.rows):
+            return False
+        if x % 2 and y % 2:
+            return True
+        if y % 2:
+            # The wall east of the cell on the left
+            return not self.get_cell_walls(x // 2 - 1, y // 2) & EAST
+        if x % 2:
+            # The wall south of the cell above
+            return not self.get_cell_walls(x // 2, y // 2 - 1) & SOUTH
+        return False
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Counts the cells of each kind, one row at a time.
+
+        A passage is an open wall between two cells. A perfect maze has
+        exactly one passage less than open cells, the extra passages of
+        an imperfect one each create a loop.
+
+        Returns:
+            dict[str, int]: The size of the maze, its open and closed (logo)
+            cells, passages, extra passages, dead ends and the length of the
+            path of the file.
+        """
+        counts = [0] * 16
+        for row in range(self.rows):
+            walls = self.get_walls(row)
+            for value in range(16):
+                counts[value] += walls.count(value)
+
+        closed = counts[15]
+        cells = self.cols * self.rows
+        passages = sum(count * OPEN_SIDES[value]
+                       for value, count in enumerate(counts)) // 2
+        return {"width": self.cols,
+                "height": self.rows,
+                "cells": cells,
+                "closed_cells": closed,
+                "open_cells": cells - closed,
+                "passages": passages,
+                "extra_passages": passages - (cells - closed - 1),
+                "dead_ends": sum(count for value, count in enumerate(counts)
+                                 if OPEN_SIDES[value] == 1),
+                "path_length": self.path_end - self.path_start}
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+def get_decompressed(filename: str) -> BinaryIO:
+    """
+    Decompresses a .gz or .xz output file, by chunks, into an anonymous
+    temporary file, removed as soon as it is closed.
+
+    Args:
+        filename (str): The compressed output file.
+
+    Returns:
+        BinaryIO: The temporary file, holding the text of the output.
+    """
+    temp = cast(BinaryIO, tempfile.TemporaryFile())
+    try:
+        with open_output(filename, mode="rb") as file:
+            shutil.copyfileobj(file, temp, PATH_CHUNK)
+        # The file is mapped by its descriptor: its buffer must be on disk
+        temp.flush()
+        temp.seek(0)
+    except (OSError, EOFError, lzma.LZMAError) as e:
+        temp.close()
+        raise OutputFileError(f"Can't decompress {filename} ({e}).")
+    return temp
+
+
+def get_decoded(file: BinaryIO) -> BinaryIO:
+    """
+    Decodes a binary output file, by chunks, into an anonymous temporary
+    file holding its text, removed as soon as it is closed. The binary file
+    is closed.
+
+    Args:
+        file (BinaryIO): The binary output file.
+
+    Returns:
+        BinaryIO: The temporary file, holding the text of the output.
+    """
+    temp = cast(BinaryIO, tempfile.TemporaryFile())
+    try:
+        with file:
+            file.seek(0)
+            write_text(file, temp)
+        temp.flush()
+        temp.seek(0)
+    except OSError as e:
+        temp.close()
+        raise OutputFileError(f"Can't decode {file.name} ({e.strerror}).")
+    except OutputFileError:
+        temp.close()
+        raise
+    return temp
+
+
+def write_text(file: BinaryIO, output: BinaryIO) -> None:
+    """
+    Writes the text form of a binary output file, one row at a time.
+
+    Args:
+        file (BinaryIO): The binary output file, at its beginning.
+        output (BinaryIO): The file receiving the text.
+    """
+    cols, rows, xentry, yentry, xexit, yexit, steps = read_header(file)
+    for row in get_binary_rows(file, cols, rows):
+        output.write(row.translate(HEX_TABLE) + b"\n")
+    output.write(f"\n{xentry},{yentry}\n{xexit},{yexit}\n".encode())
+    for letters in get_binary_path(file, steps):
+        output.write(letters)
+    output.write(b"\n")
+
+
+def get_coords(line: bytes) -> tuple[int, int]:
+    """
+    Converts a "x,y" line of an output file into coordinates.
+
+    Args:
+        line (bytes): The line to convert.
+
+    Returns:
+        tuple[int, int]: The coordinates.
+    """
+    try:
+        x, y = (int(value) for value in line.split(b","))
+    except ValueError:
+        raise OutputFileError(f"Bad coordinates {line!r}, expected x,y.")
+    return (x, y)
+
+
+def get_first_difference(first: bytes, second: bytes) -> int:
+    """
+    Returns the first index where two byte strings of the same length
+    differ.
+
+    Args:
+        first (bytes): The first string.
+        second (bytes): The second string.
+
+    Returns:
+        int: The index of the first difference.
+    """
+    return next(i for i, (a, b) in enumerate(zip(first, second)) if a != b)
+
+
+def convert_output(filename: str, force: bool = False) -> str:
+    """
+    Converts an output file between the text and the binary formats (see
+    src/output/binary.py), next to it: maze.txt (or maze.txt.gz, ...)
+    gives maze.mzb, and maze.mzb gives maze.txt. Both sides are read and
+    written by chunks.
+
+    Args:
+        filename (str): The output file to convert.
+        force (bool): Whether an existing converted file can be replaced.
+
+    Returns:
+        str: The name of the converted file.
+    """
+    stem, ext = split_output_name(filename)
+    target = stem + (".txt" if ext == BINARY_EXT else BINARY_EXT)
+    if not force and os.path.exists(target):
+        raise OutputFileError(f"{target} already exists, use --force to "
+                              "replace it.")
+    if ext != BINARY_EXT:
+        with MazeFile(filename) as maze_file:
+            write_binary(target, maze_file.entry, maze_file.exit,
+                         (maze_file.get_walls(row)
+                          for row in range(maze_file.rows)),
+                         maze_file.get_path())
+        return target
+
+    try:
+        with open(filename, "rb") as file, open(target, "wb") as output:
+            write_text(file, output)
+    except OSError as e:
+        raise OutputFileError(f"Can't convert {filename} ({e.strerror}).")
+    return target
+
+
+def read_output(filename: str, action: str, force: bool = False) -> int:
+    """
+    Runs an action of the command line on an existing output file, and
+    prints its result: "solve" prints a shortest path, "validate" the
+    errors of the file, "stats" the statistics of the maze, as JSON, and
+    "convert" the name of the file converted to the other format.
+
+    Args:
+        filename (str): The output file, in any output format.
+        action (str): "solve", "validate", "stats" or "convert".
+        force (bool): Whether "convert" can replace an existing file.
+
+    Returns:
+        int: The exit status, 1 if the file is invalid or can't be solved.
+    """
+    if action == "convert":
+        print(f"Converted to {convert_output(filename, force)}")
+        return 0
+
+    with MazeFile(filename) as maze_file:
+        if action == "solve":
+            path = maze_file.solve()
+            if not path:
+                print(f"The exit of {filename} can't be reached.")
+                return 1
+            print(path)
+            return 0
+
+        if action == "validate":
+            errors = maze_file.validate()
+            for error in errors:
+                print(f"{OutputFileError.__name__}: {error}")
+            if errors:
+                return 1
+            print(f"{filename} is valid.")
+            return 0
+
+        print(json.dumps(maze_file.get_stats(), indent=1))
+        return 0
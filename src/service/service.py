@@ -0,0 +1,461 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  service.py                                        :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 21:14:08 by alebaron        #+#    #+#               #
+#  Updated: 2026/10/18 21:14:08 by alebaron        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from src.maze.Maze import Maze, get_logo_cells
+from src.maze.Maze_Generator import Maze_Generator
+from src.maze.resolution import resolution
+from src.output.output import put_maze_val, split_output_name
+from src.configuration.check_config_error import parse_config
+from src.cache.cache import MazeCache
+from src.utils.error import ServiceError
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Any
+import asyncio
+import io
+import json
+import os
+import shutil
+import signal
+import tempfile
+import time
+
+
+# +-------------------------------------------------------------------------+
+# |                                Variable                                 |
+# +-------------------------------------------------------------------------+
+
+# Largest JSON body accepted, and bytes of output sent at once
+MAX_BODY = 1 << 20
+STREAM_CHUNK = 1 << 16
+
+# Largest maze generated for a request (WIDTH x HEIGHT), by default: one
+# request must not be able to exhaust the memory of a worker
+MAX_CELLS = 4001 * 4001
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 413: "Payload Too Large",
+           500: "Internal Server Error", 503: "Service Unavailable"}
+
+CONTENT_TYPES = {".txt": "text/plain", ".txt.gz": "application/gzip",
+                 ".txt.xz": "application/x-xz",
+                 ".mzb": "application/octet-stream"}
+
+# Routes of the service: path -> (method, request kind)
+ROUTES = {"/health": ("GET", "health"),
+          "/generate": ("POST", "generate"),
+          "/solve": ("POST", "solve")}
+
+
+# +-------------------------------------------------------------------------+
+# |                                 Class                                   |
+# +-------------------------------------------------------------------------+
+
+class MazeService:
+    """
+    Generation service, answering HTTP requests on a local port or a Unix
+    socket.
+
+    The requests are JSON objects with the keys of the config file. The
+    mazes are generated in a pool of processes started (and warmed up)
+    with the service, so a request never pays for starting an interpreter
+    and importing the program. The event loop itself only parses the
+    requests and streams the answers back, and a request arriving while
+    `concurrency` others are running is refused at once (503), instead of
+    waiting in an ever growing queue. A maze of more than `max_cells`
+    cells is refused too (400), before it reaches the pool.
+
+    Routes:
+        GET /health: The state of the service, as JSON.
+        POST /generate: The output file of the maze, in the format of
+            OUTPUT_FILE (maze.txt by default): text, compressed text or
+            binary.
+        POST /solve: The solution of the maze, as JSON.
+
+    Attributes:
+        workers (int): Number of processes of the pool.
+        concurrency (int): Requests run at the same time, at most.
+        cache (MazeCache | None): The mazes already generated.
+        max_cells (int): Largest WIDTH x HEIGHT of a request.
+        running (int): Requests currently running.
+        served (int): Requests answered since the start.
+        rejected (int): Requests refused because the service was busy.
+
+    Methods:
+        warm(self) -> None:
+            Starts the processes of the pool.
+
+        handle(self, reader: StreamReader, writer: StreamWriter) -> None:
+            Answers the requests of a connection.
+
+        close(self) -> None:
+            Stops the pool and removes the pending outputs.
+    """
+
+    def __init__(self, workers: int, concurrency: int,
+                 cache: MazeCache | None = None,
+                 max_cells: int = MAX_CELLS) -> None:
+        self.workers = workers
+        self.concurrency = concurrency
+        self.cache = cache
+        self.max_cells = max_cells
+        self.running = 0
+        self.served = 0
+        self.rejected = 0
+        self.started = time.monotonic()
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.directory = tempfile.mkdtemp(prefix="a_maze_ing_")
+
+    async def warm(self) -> None:
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.executor, os.getpid)
+                               for _ in range(self.workers)))
+
+    def close(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def get_health(self) -> dict[str, Any]:
+        return {"status": "busy" if self.running >= self.concurrency
+                else "ok",
+                "workers": self.workers,
+                "concurrency": self.concurrency,
+                "running": self.running,
+                "served": self.served,
+                "rejected": self.rejected,
+                "uptime": round(time.monotonic() - self.started, 3)}
+
+    async def handle(self, reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter) -> None:
+        """
+        Answers the requests of a connection, one after the other, until
+        the client closes it or asks for it to be closed.
+
+        Args:
+            reader (StreamReader): The incoming side of the connection.
+            writer (StreamWriter): The outgoing side of the connection.
+        """
+        try:
+            keep_alive = True
+            while keep_alive:
+                request = await read_request(reader)
+                if request is None:
+                    break
+                method, target, keep_alive, body = request
+                keep_alive = await self.answer(writer, method, target,
+                                               body, keep_alive)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except ServiceError as e:
+            await send_json(writer, 400, {"error": str(e)}, False)
+        finally:
+            writer.close()
+
+    async def answer(self, writer: asyncio.StreamWriter, method: str,
+                     target: str, body: bytes, keep_alive: bool) -> bool:
+        """
+        Answers one request.
+
+        Args:
+            writer (StreamWriter): The connection.
+            method (str): The HTTP method of the request.
+            target (str): The path of the request.
+            body (bytes): The body of the request.
+            keep_alive (bool): Whether the client keeps the connection.
+
+        Returns:
+            bool: Whether the connection can be kept.
+        """
+        if target not in ROUTES:
+            await send_json(writer, 404, {"error": f"No route {target}."},
+                            keep_alive)
+            return keep_alive
+        expected, kind = ROUTES[target]
+        if method != expected:
+            await send_json(writer, 405, {"error": f"{target} expects "
+                                          f"{expected}."}, keep_alive)
+            return keep_alive
+        if kind == "health":
+            await send_json(writer, 200, self.get_health(), keep_alive)
+            return keep_alive
+
+        try:
+            config = get_request_config(body, self.max_cells)
+        except ServiceError as e:
+            await send_json(writer, 400, {"error": str(e)}, keep_alive)
+            return keep_alive
+        if self.running >= self.concurrency:
+            self.rejected += 1
+            await send_json(writer, 503, {"error": "The service is busy, "
+                                          "try again later."}, keep_alive)
+            return keep_alive
+
+        self.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self.executor, run_request, config, self.cache,
+                self.directory if kind == "generate" else None)
+        except Exception as e:
+            await send_json(writer, 500, {"error": f"{type(e).__name__}: "
+                                          f"{e}"}, keep_alive)
+            return keep_alive
+        finally:
+            self.running -= 1
+        self.served += 1
+
+        if kind == "solve":
+            await send_json(writer, 200, result, keep_alive)
+            return keep_alive
+        try:
+            await send_file(writer, result["output_file"], {
+                "X-Path-Length": str(result["path_length"]),
+                "X-Seconds": str(result["seconds"])}, keep_alive)
+        finally:
+            os.remove(result["output_file"])
+        return keep_alive
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+def get_request_config(body: bytes,
+                       max_cells: int = MAX_CELLS) -> dict[str, Any]:
+    """
+    Converts the JSON body of a request into a configuration, checked
+    exactly like a config file. The values can be strings written as in
+    the file, or their JSON counterparts (numbers, true/false, [x, y]);
+    OUTPUT_FILE defaults to maze.txt, and the maze is always headless. A
+    maze of more than max_cells cells, or with an entry or an exit on the
+    42 logo, is refused too.
+
+    Args:
+        body (bytes): The body of the request.
+        max_cells (int): Largest WIDTH x HEIGHT accepted.
+
+    Returns:
+        dict: The processed configuration dictionary.
+    """
+    try:
+        values = json.loads(body)
+    except ValueError as e:
+        raise ServiceError(f"The body is not valid JSON ({e}).")
+    if not isinstance(values, dict):
+        raise ServiceError("The body must be a JSON object.")
+    values.setdefault("OUTPUT_FILE", "maze.txt")
+
+    lines = []
+    for key, value in values.items():
+        if value is None:
+            continue
+        if isinstance(value, list):
+            value = ",".join(str(item) for item in value)
+        lines.append(f"{key}={value}")
+
+    # The checks of the config file print their error and exit
+    with redirect_stdout(io.StringIO()) as output:
+        try:
+            config = parse_config(lines, "the request")
+        except SystemExit:
+            raise ServiceError(output.getvalue().strip())
+    if config["WIDTH"] * config["HEIGHT"] > max_cells:
+        raise ServiceError(f"The maze must have at most {max_cells} cells "
+                           "(WIDTH x HEIGHT).")
+    # Maze() exits when the entry or the exit is on the logo, which would
+    # stop the whole service from a worker
+    logo = get_logo_cells(config["WIDTH"], config["HEIGHT"])
+    for key in ("ENTRY", "EXIT"):
+        if config[key] in logo:
+            raise ServiceError(f"{key} {config[key]} is on the 42 logo.")
+    config["HEADLESS"] = True
+    return config
+
+
+def run_request(config: dict[str, Any], cache: MazeCache | None,
+                directory: str | None) -> dict[str, Any]:
+    """
+    Generates and solves the maze of a request. This is the task run by
+    the worker processes.
+
+    Args:
+        config (dict): The configuration of the request.
+        cache (MazeCache | None): The mazes already generated.
+        directory (str | None): Where to write the output file, or None to
+            only return the solution.
+
+    Returns:
+        dict: The length of the solution and the time spent, with the
+        output file, or the solution itself without a directory.
+    """
+    start = time.perf_counter()
+    maze = Maze(config["WIDTH"], config["HEIGHT"],
+                config["ENTRY"], config["EXIT"], {})
+    path = cache.load(maze, config) if cache is not None else None
+    if path is None:
+        # The requests are already spread over the processes
+        Maze_Generator(workers=1).generate(maze, config)
+        path = resolution(maze, config)
+        if cache is not None:
+            cache.store(maze, config, path)
+
+    result: dict[str, Any] = {"path_length": len(path)}
+    if directory is None:
+        result["path"] = path
+    else:
+        _, ext = split_output_name(config["OUTPUT_FILE"])
+        handle, filename = tempfile.mkstemp(suffix=ext, dir=directory)
+        os.close(handle)
+        put_maze_val(maze, filename, path,
+                     level=config["COMPRESSION_LEVEL"])
+        result["output_file"] = filename
+    result["seconds"] = round(time.perf_counter() - start, 6)
+    return result
+
+
+async def read_request(reader: asyncio.StreamReader
+                       ) -> tuple[str, str, bool, bytes] | None:
+    """
+    Reads an HTTP/1.x request: its request line, its headers and its body.
+
+    Args:
+        reader (StreamReader): The incoming side of the connection.
+
+    Returns:
+        tuple | None: The method, the path, whether the connection is kept
+        and the body, or None once the client has closed the connection.
+    """
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        raise ServiceError("Bad request line.")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip().lower()
+
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise ServiceError("Bad Content-Length.")
+    if not 0 <= length <= MAX_BODY:
+        raise ServiceError(f"The body must be at most {MAX_BODY} bytes.")
+
+    connection = headers.get("connection", "")
+    keep_alive = (connection != "close" if version == "HTTP/1.1"
+                  else connection == "keep-alive")
+    return method, target.split("?")[0], keep_alive, \
+        await reader.readexactly(length)
+
+
+def get_head(status: int, length: int, content_type: str, keep_alive: bool,
+             headers: dict[str, str] | None = None) -> bytes:
+    lines = [f"HTTP/1.1 {status} {REASONS[status]}",
+             f"Content-Type: {content_type}",
+             f"Content-Length: {length}",
+             f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def send_json(writer: asyncio.StreamWriter, status: int,
+                    value: dict[str, Any], keep_alive: bool) -> None:
+    body = json.dumps(value).encode()
+    writer.write(get_head(status, len(body), "application/json",
+                          keep_alive) + body)
+    await writer.drain()
+
+
+async def send_file(writer: asyncio.StreamWriter, filename: str,
+                    headers: dict[str, str], keep_alive: bool) -> None:
+    """
+    Streams an output file to the client, by chunks, waiting for each one
+    to be sent before reading the next.
+
+    Args:
+        writer (StreamWriter): The connection.
+        filename (str): The output file.
+        headers (dict): Additional headers of the answer.
+        keep_alive (bool): Whether the connection is kept.
+    """
+    _, ext = split_output_name(filename)
+    writer.write(get_head(200, os.path.getsize(filename),
+                          CONTENT_TYPES.get(ext, "application/octet-stream"),
+                          keep_alive, headers))
+    with open(filename, "rb") as file:
+        while chunk := file.read(STREAM_CHUNK):
+            writer.write(chunk)
+            await writer.drain()
+
+
+async def serve(address: str, service: MazeService) -> None:
+    """
+    Starts the pool, then answers the requests until interrupted (SIGINT
+    or SIGTERM).
+
+    Args:
+        address (str): "HOST:PORT", or "unix:PATH" for a Unix socket.
+        service (MazeService): The service answering the requests.
+    """
+    await service.warm()
+    if address.startswith("unix:"):
+        server = await asyncio.start_unix_server(service.handle,
+                                                 address[len("unix:"):])
+    else:
+        host, _, port = address.rpartition(":")
+        server = await asyncio.start_server(service.handle,
+                                            host or "localhost", int(port))
+    print(f"Serving on {address} with {service.workers} workers")
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+    async with server:
+        await stop.wait()
+
+
+def run_service(address: str, workers: int | None, concurrency: int | None,
+                cache: MazeCache | None = None,
+                max_cells: int | None = None) -> None:
+    """
+    Runs the generation service (see MazeService).
+
+    Args:
+        address (str): "HOST:PORT", or "unix:PATH" for a Unix socket.
+        workers (int | None): Number of processes, CPU count by default.
+        concurrency (int | None): Requests run at the same time, twice the
+            number of workers by default.
+        cache (MazeCache | None): The mazes already generated.
+        max_cells (int | None): Largest WIDTH x HEIGHT of a request,
+            MAX_CELLS by default.
+    """
+    workers = workers or os.cpu_count() or 1
+    service = MazeService(workers, concurrency or 2 * workers, cache,
+                          max_cells or MAX_CELLS)
+    try:
+        asyncio.run(serve(address, service))
+    finally:
+        service.close()
+    print("Service stopped.")
@@ -29,6 +29,20 @@ class MenuError(Exception):
     pass
 
 
+class OutputFileError(Exception):
+    """
+    Exception raised when an output file can't be read.
+    """
+    pass
+
+
+class ServiceError(Exception):
+    """
+    Exception raised for the invalid requests of the service.
+    """
+    pass
+
+
 # +-------------------------------------------------------------------------+
 # |                                Function                                 |
 # +-------------------------------------------------------------------------+
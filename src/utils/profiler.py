@@ -0,0 +1,141 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  profiler.py                                       :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 14:02:10 by tcolson         #+#    #+#               #
+#  Updated: 2026/10/18 14:02:10 by tcolson         ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from src.maze.Maze import Maze
+from src.maze.observer import MazeObserver
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TypeVar, cast
+import os
+import time
+
+# cProfile and json are only needed by a profiled run, they are imported
+# when used so that the other runs start faster
+if TYPE_CHECKING:
+    import cProfile
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+# +-------------------------------------------------------------------------+
+# |                                 Class                                   |
+# +-------------------------------------------------------------------------+
+
+class Profiler:
+    """
+    Collects hot-path counters and phase timings of a run.
+
+    The generator, the solver and the output only receive a profiler when
+    profiling is asked for. Otherwise they get None and run exactly the
+    same code as before, so a disabled profiler costs nothing.
+
+    Attributes:
+        counters (dict[str, int]): Named counters (neighbor lookups, ...).
+        phases (dict[str, float]): Seconds spent in each named phase.
+        cprofile (cProfile.Profile | None): The cProfile profiler, if a
+            pstats dump was asked for.
+
+    Methods:
+        count(self, name: str, amount: int = 1) -> None:
+            Adds an amount to a counter.
+
+        counted(self, name: str, function: F) -> F:
+            Wraps a function so that each call is counted.
+
+        phase(self, name: str) -> Iterator[None]:
+            Context manager timing a phase of the run.
+
+        report(self) -> dict[str, Any]:
+            Returns the counters and timings.
+
+        write(self, filename: str) -> None:
+            Writes the report as JSON, and the pstats dump next to it.
+    """
+
+    def __init__(self, cprofile: bool = False) -> None:
+        self.counters: dict[str, int] = {}
+        self.phases: dict[str, float] = {}
+        self.cprofile: "cProfile.Profile | None" = None
+        if cprofile:
+            from cProfile import Profile
+            self.cprofile = Profile()
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def counted(self, name: str, function: F) -> F:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            self.count(name)
+            return function(*args, **kwargs)
+        return cast(F, wrapper)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if self.cprofile:
+            self.cprofile.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = (self.phases.get(name, 0.0)
+                                 + time.perf_counter() - start)
+            if self.cprofile:
+                self.cprofile.disable()
+
+    def report(self) -> dict[str, Any]:
+        return {"phases": {name: round(seconds, 6)
+                           for name, seconds in self.phases.items()},
+                "counters": dict(sorted(self.counters.items()))}
+
+    def write(self, filename: str) -> None:
+        import json
+
+        with open(filename, "w") as file:
+            json.dump(self.report(), file, indent=1)
+        if self.cprofile:
+            self.cprofile.dump_stats(os.path.splitext(filename)[0]
+                                     + ".pstats")
+
+
+class CountingObserver(MazeObserver):
+    """
+    Forwards every notification to another observer while counting, in a
+    profiler, those it renders. The methods the observer doesn't override
+    do nothing (e.g. in a headless run), so they aren't counted.
+    """
+
+    def __init__(self, observer: MazeObserver, profiler: Profiler) -> None:
+        self.observer = observer
+        self.profiler = profiler
+        kind = type(observer)
+        self.renders_cells = kind.cell_changed is not MazeObserver.cell_changed
+        self.renders_steps = kind.refresh is not MazeObserver.refresh
+
+    def start(self, maze: Maze) -> None:
+        self.observer.start(maze)
+
+    def cell_changed(self, maze: Maze, cell: tuple[int, int]) -> None:
+        if self.renders_cells:
+            self.profiler.count("render_calls")
+        self.observer.cell_changed(maze, cell)
+
+    def refresh(self, maze: Maze) -> None:
+        if self.renders_steps:
+            self.profiler.count("render_calls")
+        self.observer.refresh(maze)
+
+    def stop(self, maze: Maze) -> None:
+        self.observer.stop(maze)
@@ -0,0 +1,11 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  __init__.py                                       :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 23:14:52 by tcolson         #+#    #+#               #
+#  Updated: 2026/10/18 23:14:52 by tcolson         ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
@@ -0,0 +1,89 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  test_output.py                                    :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 23:14:52 by tcolson         #+#    #+#               #
+#  Updated: 2026/10/18 23:14:52 by tcolson         ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from src.maze.Maze import Maze
+from src.maze.Maze_Generator import Maze_Generator
+from src.maze.resolution import resolution
+from src.output.output import put_maze_val
+from src.output.reader import MazeFile, convert_output
+from src.utils.error import OutputFileError
+from output_validator import validate
+from pathlib import Path
+from typing import Any
+import pytest
+
+
+# +-------------------------------------------------------------------------+
+# |                                Variable                                 |
+# +-------------------------------------------------------------------------+
+
+# Small enough for the whole output to fit in the buffers of the writers
+SIZE = 19
+OUTPUT_EXTS = [".txt", ".txt.gz", ".txt.xz", ".mzb"]
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+@pytest.fixture(scope="module")
+def solved() -> tuple[Maze, str]:
+    config: dict[str, Any] = {
+        "WIDTH": SIZE, "HEIGHT": SIZE, "ENTRY": (1, 1),
+        "EXIT": (SIZE - 2, SIZE - 2), "PERFECT": True, "SEED": 42,
+        "HIDE": True, "HEADLESS": True, "SOLVER": "BFS"}
+    maze = Maze(SIZE, SIZE, config["ENTRY"], config["EXIT"], {})
+    Maze_Generator(workers=1).generate(maze, config)
+    return maze, resolution(maze, config)
+
+
+@pytest.mark.parametrize("ext", OUTPUT_EXTS)
+def test_round_trip(solved: tuple[Maze, str], tmp_path: Path,
+                    ext: str) -> None:
+    """
+    A small maze written in every output format reads back the same with
+    MazeFile (--validate, --solve, --stats) and output_validator.py.
+    """
+    maze, path = solved
+    filename = str(tmp_path / ("maze" + ext))
+    put_maze_val(maze, filename, path)
+
+    with MazeFile(filename) as maze_file:
+        assert maze_file.validate() == []
+        assert len(maze_file.solve()) == len(path)
+        assert maze_file.get_stats()["cells"] == (SIZE // 2) ** 2
+    assert validate(filename, 1) == (0, [])
+
+
+def test_convert_refuses_overwrite(solved: tuple[Maze, str],
+                                   tmp_path: Path) -> None:
+    """
+    --convert keeps an existing target file, unless it is forced.
+    """
+    maze, path = solved
+    filename = str(tmp_path / "maze.txt")
+    put_maze_val(maze, filename, path)
+    target = tmp_path / "maze.mzb"
+    target.write_bytes(b"keep")
+
+    with pytest.raises(OutputFileError, match="already exists"):
+        convert_output(filename)
+    assert target.read_bytes() == b"keep"
+
+    assert convert_output(filename, force=True) == str(target)
+    with MazeFile(str(target)) as maze_file:
+        assert maze_file.validate() == []
@@ -0,0 +1,61 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  test_service.py                                   :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: alebaron, tcolson                         +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/10/18 23:21:37 by tcolson         #+#    #+#               #
+#  Updated: 2026/10/18 23:21:37 by tcolson         ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+# +-------------------------------------------------------------------------+
+# |                               Importation                               |
+# +-------------------------------------------------------------------------+
+
+
+from src.service.service import get_request_config
+from src.utils.error import ServiceError
+import json
+import pytest
+
+
+# +-------------------------------------------------------------------------+
+# |                                Function                                 |
+# +-------------------------------------------------------------------------+
+
+def get_body(**values: object) -> bytes:
+    request = {"WIDTH": 19, "HEIGHT": 19, "ENTRY": [1, 1], "EXIT": [17, 17],
+               "PERFECT": True}
+    request.update(values)
+    return json.dumps(request).encode()
+
+
+def test_request_config() -> None:
+    config = get_request_config(get_body(SEED=4))
+    assert config["ENTRY"] == (1, 1)
+    assert config["SEED"] == 4
+    assert config["HEADLESS"] is True
+
+
+@pytest.mark.parametrize("values", [{"ENTRY": [8, 9]}, {"EXIT": [12, 7]}])
+def test_logo_refused(values: dict[str, list[int]]) -> None:
+    """
+    An entry or an exit on the 42 logo is refused before the request
+    reaches a worker, where Maze() would exit.
+    """
+    with pytest.raises(ServiceError, match="logo"):
+        get_request_config(get_body(**values))
+
+
+def test_max_cells() -> None:
+    """
+    A maze larger than the limit of the service is refused, whatever the
+    memory left to the workers.
+    """
+    assert get_request_config(get_body(), max_cells=19 * 19)["WIDTH"] == 19
+    with pytest.raises(ServiceError, match="at most"):
+        get_request_config(get_body(WIDTH=21), max_cells=19 * 19)
+    with pytest.raises(ServiceError, match="at most"):
+        get_request_config(get_body(WIDTH=100001, HEIGHT=100001))